@@ -19,6 +19,9 @@ from uuid import UUID
 import neo4j  # noqa: F401 - kept for tests that patch api.attack_paths.database.neo4j
 from api.attack_paths import ingest
 from api.attack_paths import sink as sink_module
+from api.attack_paths.neo4j_codes import (  # noqa: F401 - re-exported for scan tasks
+    DATABASE_NOT_FOUND_CODE,
+)
 from config.env import env
 from django.conf import (
     settings,  # noqa: F401 - kept for tests that patch ...database.settings
@@ -27,7 +30,6 @@ from django.conf import (
 MAX_CUSTOM_QUERY_NODES = env.int("ATTACK_PATHS_MAX_CUSTOM_QUERY_NODES", default=250)
 
 TEMP_DB_PREFIX = "db-tmp-scan-"
-DATABASE_NOT_FOUND_CODE = "Neo.ClientError.Database.DatabaseNotFound"
 
 
 # Exceptions
@@ -216,6 +218,7 @@ def has_provider_data(database: str, provider_id: str) -> bool:
 
 
 def clear_cache(database: str) -> None:
+    """Drop the query plan cache; scan jobs only, never on a request path."""
     if _is_ingest_database(database):
         ingest.clear_cache(database)
         return
@@ -16,6 +16,11 @@ from typing import Any
 
 import neo4j
 import neo4j.exceptions
+from api.attack_paths.neo4j_codes import (
+    ACCESS_MODE_CODE,
+    CLIENT_STATEMENT_EXCEPTION_PREFIX,
+    READ_EXCEPTION_CODES,
+)
 from api.attack_paths.retryable_session import RetryableSession
 from config.env import env
 from django.conf import settings
@@ -31,7 +36,9 @@ CONN_ACQUISITION_TIMEOUT = env.int("NEO4J_CONN_ACQUISITION_TIMEOUT", default=15)
 # host can't pin a worker on a temp-DB op longer than this.
 CONNECTION_TIMEOUT = env.int("NEO4J_CONNECTION_TIMEOUT", default=5)
 MAX_CONNECTION_LIFETIME = env.int("NEO4J_MAX_CONNECTION_LIFETIME", default=7200)
-MAX_CONNECTION_POOL_SIZE = env.int("NEO4J_MAX_CONNECTION_POOL_SIZE", default=50)
+# Same default as the sink driver; the pool is a cap and only grows on demand
+MAX_CONNECTION_POOL_SIZE = env.int("NEO4J_MAX_CONNECTION_POOL_SIZE", default=100)
+
 
 _driver: neo4j.Driver | None = None
 _lock = threading.Lock()
@@ -43,7 +50,10 @@ def _neo4j_config() -> dict:
 
 def get_uri() -> str:
     """Bolt URI for the Neo4j temp (ingest) database. Always Neo4j."""
-    config = _neo4j_config()
+    return _uri_from_config(_neo4j_config())
+
+
+def _uri_from_config(config: dict) -> str:
     host = config["HOST"]
     port = config["PORT"]
     if not host or not port:
@@ -58,14 +68,18 @@ def get_uri() -> str:
 def init_driver() -> neo4j.Driver:
     """Initialize the temp-database Neo4j driver. Idempotent."""
     global _driver
+    # Lock-free fast path: once the driver exists this is a single global
+    # read. `functools.cache` is not a drop-in here, since racing first calls
+    # would each run the factory and leak every driver but the cached one.
     if _driver is not None:
         return _driver
 
     with _lock:
         if _driver is None:
+            # One settings read per init; the driver keeps URI and auth after that
             config = _neo4j_config()
             _driver = neo4j.GraphDatabase.driver(
-                get_uri(),
+                _uri_from_config(config),
                 auth=(config["USER"], config["PASSWORD"]),
                 keep_alive=True,
                 max_connection_lifetime=MAX_CONNECTION_LIFETIME,
@@ -117,12 +131,6 @@ def get_session(
         WriteQueryNotAllowedException,
     )
 
-    READ_EXCEPTION_CODES = [
-        "Neo.ClientError.Statement.AccessMode",
-        "Neo.ClientError.Procedure.ProcedureNotFound",
-    ]
-    CLIENT_STATEMENT_EXCEPTION_PREFIX = "Neo.ClientError.Statement."
-
     session_wrapper: RetryableSession | None = None
     try:
         session_wrapper = RetryableSession(
@@ -140,7 +148,7 @@ def get_session(
             and exc.code in READ_EXCEPTION_CODES
         ):
             raise WriteQueryNotAllowedException(
-                message="Read query not allowed", code=READ_EXCEPTION_CODES[0]
+                message="Read query not allowed", code=ACCESS_MODE_CODE
             )
 
         message = exc.message if exc.message is not None else str(exc)
@@ -0,0 +1,8 @@
+"""Neo4j (Bolt) error codes shared by the ingest driver and the sink backends."""
+
+ACCESS_MODE_CODE = "Neo.ClientError.Statement.AccessMode"
+CLIENT_STATEMENT_EXCEPTION_PREFIX = "Neo.ClientError.Statement."
+DATABASE_NOT_FOUND_CODE = "Neo.ClientError.Database.DatabaseNotFound"
+PROCEDURE_NOT_FOUND_CODE = "Neo.ClientError.Procedure.ProcedureNotFound"
+# Codes a READ_ACCESS session raises for a write; looked up on every failed query
+READ_EXCEPTION_CODES = frozenset({ACCESS_MODE_CODE, PROCEDURE_NOT_FOUND_CODE})
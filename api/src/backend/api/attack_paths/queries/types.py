@@ -1,5 +1,6 @@
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cached_property
 
 
 @dataclass(frozen=True)
@@ -72,3 +73,13 @@ class AttackPathsQueryDefinition:
     attribution: AttackPathsQueryAttribution | None = None
     outcome: AttackPathsQueryOutcome | None = None
     parameters: list[AttackPathsQueryParameterDefinition] = field(default_factory=list)
+
+    # Definitions are module-level constants, so these are built once and
+    # reused by every request's parameter validation
+    @cached_property
+    def expected_names(self) -> frozenset[str]:
+        return frozenset(self.parameter_casts)
+
+    @cached_property
+    def parameter_casts(self) -> dict[str, type]:
+        return {parameter.name: parameter.cast for parameter in self.parameters}
@@ -33,7 +33,19 @@ class RetryExhaustedError(Exception):
 
 
 class RetryableSession:
-    """Wrapper around ``neo4j.Session`` with a refreshable retry policy."""
+    """Wrapper around ``neo4j.Session`` with a refreshable retry policy.
+
+    Managed transactions (``execute_read`` / ``execute_write``) already retry
+    transient errors inside the driver, bounded by ``max_transaction_retry_time``.
+    This wrapper only covers what the driver can't recover from on the same
+    session (lost connections, expired sessions), and ``max_retry_time_seconds``
+    caps the time spent here so the two retry layers can't stack past the
+    caller's budget.
+
+    ``max_retry_time_seconds`` is only set for read sessions, and it also opts
+    into retrying ``SessionExpired``: replaying a read is harmless, while a write
+    may already have committed before the session expired.
+    """
 
     def __init__(
         self,
@@ -42,12 +54,14 @@ class RetryableSession:
         retry_if: Callable[[Exception], bool] | None = None,
         initial_retry_delay_seconds: float = 0,
         retry_context: str | None = None,
+        max_retry_time_seconds: float | None = None,
     ) -> None:
         self._session_factory = session_factory
         self._max_retries = max(0, max_retries)
         self._retry_if = retry_if
         self._initial_retry_delay_seconds = max(0.0, initial_retry_delay_seconds)
         self._retry_context = retry_context
+        self._max_retry_time_seconds = max_retry_time_seconds
         self._session = self._session_factory()
 
     def close(self) -> None:
@@ -91,8 +105,11 @@ class RetryableSession:
 
                 last_exc = exc
                 attempt += 1
+                delay = (
+                    self._retry_delay(attempt) if attempt <= self._max_retries else 0
+                )
 
-                if attempt > self._max_retries:
+                if attempt > self._max_retries or self._out_of_time(started_at, delay):
                     if self._retry_context is not None:
                         raise RetryExhaustedError(
                             retry_context=self._retry_context,
@@ -103,7 +120,6 @@ class RetryableSession:
                         ) from exc
                     raise
 
-                delay = self._retry_delay(attempt)
                 if self._retry_context is not None:
                     error_message = getattr(exc, "message", None) or str(exc)
                     logger.warning(
@@ -141,8 +157,19 @@ class RetryableSession:
             ),
         ):
             return True
+        if (
+            isinstance(exc, neo4j.exceptions.SessionExpired)
+            and self._max_retry_time_seconds is not None
+        ):
+            return True
         return self._retry_if(exc) if self._retry_if else False
 
+    def _out_of_time(self, started_at: float, delay: float) -> bool:
+        # Give up instead of starting an attempt that would begin past the budget
+        if self._max_retry_time_seconds is None:
+            return False
+        return time.monotonic() - started_at + delay >= self._max_retry_time_seconds
+
     def _retry_delay(self, attempt: int) -> float:
         max_delay = self._initial_retry_delay_seconds * (2**attempt)
         return random.uniform(max_delay / 2, max_delay) if max_delay else 0
@@ -1,4 +1,4 @@
-"""Protocol every sink backend must implement."""
+"""Protocol every sink backend must implement, plus shared read helpers."""
 
 from contextlib import AbstractContextManager
 from typing import Any, Protocol
@@ -43,7 +43,14 @@ class SinkDatabase(Protocol):
         database: str,
         cypher: str,
         parameters: dict[str, Any] | None = None,
-    ) -> neo4j.graph.Graph: ...
+    ) -> neo4j.graph.Graph:
+        """Run a read-only query and return its hydrated graph.
+
+        Values must be passed as `$parameters`, never formatted into `cypher`:
+        the plan cache is keyed by query text, so only structural identifiers
+        (labels, database names) may be interpolated.
+        """
+        ...
 
     def create_database(self, database: str) -> None: ...
 
@@ -53,7 +60,13 @@ class SinkDatabase(Protocol):
 
     def has_provider_data(self, database: str, provider_id: str) -> bool: ...
 
-    def clear_cache(self, database: str) -> None: ...
+    def clear_cache(self, database: str) -> None:
+        """Drop the database's query plan cache.
+
+        Every following query is planned from scratch, so this is for scan
+        jobs after a sync only, never for the API request path.
+        """
+        ...
 
     def ensure_sync_indexes(self, database: str) -> None:
         """Create any index needed for the sync write path.
@@ -92,3 +105,16 @@ class SinkDatabase(Protocol):
         type (already a valid Cypher identifier).
         """
         ...
+
+
+def stream_graph(result: neo4j.Result) -> neo4j.graph.Graph:
+    """Build the result graph without buffering the result's records.
+
+    `Result.graph()` on an unread result buffers every record (paths, lists of
+    nodes) next to the hydrated graph. Draining the stream first lets each
+    record be freed as soon as it is read; the graph still holds every node
+    and relationship seen.
+    """
+    for _ in result:
+        pass
+    return result.graph()
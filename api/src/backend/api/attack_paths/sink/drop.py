@@ -26,6 +26,72 @@ NODE_DELETE_QUERY_TEMPLATE = """
     RETURN COUNT(n) AS deleted_nodes_count
     """
 
+# `apoc.periodic.iterate` variants of the templates above: the same directed
+# relationship phases and node phase, but batching runs server-side with one
+# transaction per batch instead of one Bolt round-trip per batch
+PERIODIC_RELATIONSHIP_DELETE_QUERY_TEMPLATES = {
+    "outgoing relationship": "MATCH (n:`{provider_label}`)-[r]->() RETURN r",
+    "incoming relationship": "MATCH (n:`{provider_label}`)<-[r]-() RETURN r",
+}
+
+PERIODIC_NODE_DELETE_QUERY_TEMPLATE = (
+    "MATCH (n:{provider_resource_label}:`{provider_label}`) RETURN n"
+)
+
+PERIODIC_DELETE_QUERY = """
+    CALL apoc.periodic.iterate(
+        $match_query,
+        $delete_query,
+        {batchSize: $batch_size, parallel: false}
+    )
+    YIELD total, batches, failedBatches, errorMessages
+    RETURN total, batches, failedBatches, errorMessages
+    """
+
+
+def delete_periodic(
+    *,
+    session: Any,
+    logger: logging.Logger,
+    log_target: str,
+    provider_id: str,
+    match_query: str,
+    delete_query: str,
+    phase: str,
+    batch_size: int,
+    drop_t0: float,
+) -> tuple[int, int]:
+    """Delete every row matched by `match_query` through `apoc.periodic.iterate`.
+
+    Returns `(deleted, batches)`. Raises `RuntimeError` if any batch failed,
+    since a partial drop must not be reported as a clean one.
+    """
+    record = session.run(
+        PERIODIC_DELETE_QUERY,
+        {
+            "match_query": match_query,
+            "delete_query": delete_query,
+            "batch_size": batch_size,
+        },
+    ).single()
+    if record["failedBatches"]:
+        raise RuntimeError(
+            f"apoc.periodic.iterate failed {record['failedBatches']} {phase} "
+            f"batches on {log_target}: {record['errorMessages']}"
+        )
+
+    logger.info(
+        "Deleted %s batches from %s "
+        "(provider=%s, batches=%s, deleted=%s, elapsed=%.3fs)",
+        phase,
+        log_target,
+        provider_id,
+        record["batches"],
+        record["total"],
+        time.perf_counter() - drop_t0,
+    )
+    return record["total"], record["batches"]
+
 
 def delete_batches(
     *,
@@ -15,12 +15,22 @@ from typing import Any
 
 import neo4j
 import neo4j.exceptions
+from api.attack_paths.neo4j_codes import (
+    ACCESS_MODE_CODE,
+    CLIENT_STATEMENT_EXCEPTION_PREFIX,
+    DATABASE_NOT_FOUND_CODE,
+    PROCEDURE_NOT_FOUND_CODE,
+    READ_EXCEPTION_CODES,
+)
 from api.attack_paths.retryable_session import RetryableSession
-from api.attack_paths.sink.base import SinkDatabase
+from api.attack_paths.sink.base import SinkDatabase, stream_graph
 from api.attack_paths.sink.drop import (
     NODE_DELETE_QUERY_TEMPLATE,
+    PERIODIC_NODE_DELETE_QUERY_TEMPLATE,
+    PERIODIC_RELATIONSHIP_DELETE_QUERY_TEMPLATES,
     RELATIONSHIP_DELETE_QUERY_TEMPLATES,
     delete_batches,
+    delete_periodic,
 )
 from config.env import env
 from django.conf import settings
@@ -41,14 +51,13 @@ CONN_ACQUISITION_TIMEOUT = env.int("NEO4J_CONN_ACQUISITION_TIMEOUT", default=15)
 # host can't pin a request or the readiness probe longer than this.
 CONNECTION_TIMEOUT = env.int("NEO4J_CONNECTION_TIMEOUT", default=5)
 MAX_CONNECTION_LIFETIME = env.int("NEO4J_MAX_CONNECTION_LIFETIME", default=7200)
-MAX_CONNECTION_POOL_SIZE = env.int("NEO4J_MAX_CONNECTION_POOL_SIZE", default=50)
-
-READ_EXCEPTION_CODES = [
-    "Neo.ClientError.Statement.AccessMode",
-    "Neo.ClientError.Procedure.ProcedureNotFound",
-]
-CLIENT_STATEMENT_EXCEPTION_PREFIX = "Neo.ClientError.Statement."
-DATABASE_NOT_FOUND_CODE = "Neo.ClientError.Database.DatabaseNotFound"
+# Sized for concurrent API reads: each request can pin a connection for up to
+# READ_QUERY_TIMEOUT_SECONDS, so a small pool queues requests behind each other
+MAX_CONNECTION_POOL_SIZE = env.int("NEO4J_MAX_CONNECTION_POOL_SIZE", default=100)
+# Upper bound on the driver's own managed-transaction retries for read sessions;
+# kept below READ_QUERY_TIMEOUT_SECONDS so a retried read can't run past the
+# caller's budget. Write sessions keep the driver default.
+MAX_TRANSACTION_RETRY_TIME = env.int("NEO4J_MAX_TRANSACTION_RETRY_TIME", default=15)
 
 
 class Neo4jSink(SinkDatabase):
@@ -137,13 +146,23 @@ class Neo4jSink(SinkDatabase):
             WriteQueryNotAllowedException,
         )
 
+        session_config: dict[str, Any] = {
+            "database": database,
+            "default_access_mode": default_access_mode,
+        }
+        if default_access_mode == neo4j.READ_ACCESS:
+            session_config["max_transaction_retry_time"] = MAX_TRANSACTION_RETRY_TIME
+
         session_wrapper: RetryableSession | None = None
         try:
             session_wrapper = RetryableSession(
-                session_factory=lambda: self._get_driver().session(
-                    database=database, default_access_mode=default_access_mode
-                ),
+                session_factory=lambda: self._get_driver().session(**session_config),
                 max_retries=SERVICE_UNAVAILABLE_MAX_RETRIES,
+                max_retry_time_seconds=(
+                    READ_QUERY_TIMEOUT_SECONDS
+                    if default_access_mode == neo4j.READ_ACCESS
+                    else None
+                ),
             )
             yield session_wrapper
 
@@ -154,7 +173,7 @@ class Neo4jSink(SinkDatabase):
                 and exc.code in READ_EXCEPTION_CODES
             ):
                 raise WriteQueryNotAllowedException(
-                    message="Read query not allowed", code=READ_EXCEPTION_CODES[0]
+                    message="Read query not allowed", code=ACCESS_MODE_CODE
                 )
 
             message = exc.message if exc.message is not None else str(exc)
@@ -182,7 +201,7 @@ class Neo4jSink(SinkDatabase):
                 result = tx.run(
                     cypher, parameters or {}, timeout=READ_QUERY_TIMEOUT_SECONDS
                 )
-                return result.graph()
+                return stream_graph(result)
 
             return session.execute_read(_run)
 
@@ -201,18 +220,14 @@ class Neo4jSink(SinkDatabase):
 
         Deletes relationships then nodes in batches (not `DETACH DELETE`) so a
         dense provider's graph cannot exceed Neo4j's transaction memory limit.
-        Silently returns 0 if the database doesn't exist.
+        Batching runs server-side through `apoc.periodic.iterate` when APOC is
+        installed, and falls back to one client-driven transaction per batch
+        otherwise. Silently returns 0 if the database doesn't exist.
         """
         from api.attack_paths.database import GraphDatabaseQueryException
-        from tasks.jobs.attack_paths.config import (
-            GRAPH_MUTATION_BATCH_SIZE,
-            PROVIDER_RESOURCE_LABEL,
-            get_provider_label,
-        )
+        from tasks.jobs.attack_paths.config import get_provider_label
 
         provider_label = get_provider_label(provider_id)
-        deleted_nodes = deleted_relationships = 0
-        relationship_batches = node_batches = 0
         drop_t0 = time.perf_counter()
 
         logger.info(
@@ -238,43 +253,24 @@ class Neo4jSink(SinkDatabase):
                     provider_id,
                 )
                 log_target = f"Neo4j sink database {database}"
-                for (
-                    phase,
-                    query_template,
-                ) in RELATIONSHIP_DELETE_QUERY_TEMPLATES.items():
-                    deleted_relationships, phase_batches = delete_batches(
-                        session=session,
-                        logger=logger,
-                        log_target=log_target,
-                        provider_id=provider_id,
-                        query=query_template.format(provider_label=provider_label),
-                        phase=phase,
-                        count_key="deleted_rels_count",
-                        total_key="rels",
-                        deleted_key="deleted_rels",
-                        initial_total=deleted_relationships,
-                        batch_size=GRAPH_MUTATION_BATCH_SIZE,
-                        drop_t0=drop_t0,
+                try:
+                    counts = self._drop_subgraph_periodic(
+                        session, log_target, provider_id, provider_label, drop_t0
+                    )
+
+                except neo4j.exceptions.ClientError as exc:
+                    if exc.code != PROCEDURE_NOT_FOUND_CODE:
+                        raise
+
+                    logger.info(
+                        "APOC unavailable on %s; falling back to client-side "
+                        "batched deletes (provider=%s)",
+                        log_target,
+                        provider_id,
+                    )
+                    counts = self._drop_subgraph_batched(
+                        session, log_target, provider_id, provider_label, drop_t0
                     )
-                    relationship_batches += phase_batches
-
-                deleted_nodes, node_batches = delete_batches(
-                    session=session,
-                    logger=logger,
-                    log_target=log_target,
-                    provider_id=provider_id,
-                    query=NODE_DELETE_QUERY_TEMPLATE.format(
-                        provider_label=provider_label,
-                        provider_resource_label=PROVIDER_RESOURCE_LABEL,
-                    ),
-                    phase="node",
-                    count_key="deleted_nodes_count",
-                    total_key="nodes",
-                    deleted_key="deleted_nodes",
-                    initial_total=0,
-                    batch_size=GRAPH_MUTATION_BATCH_SIZE,
-                    drop_t0=drop_t0,
-                )
 
         except GraphDatabaseQueryException as exc:
             if exc.code == DATABASE_NOT_FOUND_CODE:
@@ -288,6 +284,7 @@ class Neo4jSink(SinkDatabase):
                 return 0
             raise
 
+        relationships, relationship_batches, nodes, node_batches = counts
         logger.info(
             "Finished dropping provider graph from Neo4j sink database %s "
             "(provider=%s, relationship_batches=%s, deleted_rels=%s, "
@@ -295,12 +292,110 @@ class Neo4jSink(SinkDatabase):
             database,
             provider_id,
             relationship_batches,
-            deleted_relationships,
+            relationships,
             node_batches,
-            deleted_nodes,
+            nodes,
             time.perf_counter() - drop_t0,
         )
-        return deleted_nodes
+        return nodes
+
+    def _drop_subgraph_periodic(
+        self,
+        session: RetryableSession,
+        log_target: str,
+        provider_id: str,
+        provider_label: str,
+        drop_t0: float,
+    ) -> tuple[int, int, int, int]:
+        from tasks.jobs.attack_paths.config import (
+            GRAPH_MUTATION_BATCH_SIZE,
+            PROVIDER_RESOURCE_LABEL,
+        )
+
+        deleted_relationships = relationship_batches = 0
+        for (
+            phase,
+            match_template,
+        ) in PERIODIC_RELATIONSHIP_DELETE_QUERY_TEMPLATES.items():
+            deleted, batches = delete_periodic(
+                session=session,
+                logger=logger,
+                log_target=log_target,
+                provider_id=provider_id,
+                match_query=match_template.format(provider_label=provider_label),
+                delete_query="DELETE r",
+                phase=phase,
+                batch_size=GRAPH_MUTATION_BATCH_SIZE,
+                drop_t0=drop_t0,
+            )
+            deleted_relationships += deleted
+            relationship_batches += batches
+
+        deleted_nodes, node_batches = delete_periodic(
+            session=session,
+            logger=logger,
+            log_target=log_target,
+            provider_id=provider_id,
+            match_query=PERIODIC_NODE_DELETE_QUERY_TEMPLATE.format(
+                provider_label=provider_label,
+                provider_resource_label=PROVIDER_RESOURCE_LABEL,
+            ),
+            delete_query="DELETE n",
+            phase="node",
+            batch_size=GRAPH_MUTATION_BATCH_SIZE,
+            drop_t0=drop_t0,
+        )
+        return deleted_relationships, relationship_batches, deleted_nodes, node_batches
+
+    def _drop_subgraph_batched(
+        self,
+        session: RetryableSession,
+        log_target: str,
+        provider_id: str,
+        provider_label: str,
+        drop_t0: float,
+    ) -> tuple[int, int, int, int]:
+        from tasks.jobs.attack_paths.config import (
+            GRAPH_MUTATION_BATCH_SIZE,
+            PROVIDER_RESOURCE_LABEL,
+        )
+
+        deleted_relationships = relationship_batches = 0
+        for phase, query_template in RELATIONSHIP_DELETE_QUERY_TEMPLATES.items():
+            deleted_relationships, phase_batches = delete_batches(
+                session=session,
+                logger=logger,
+                log_target=log_target,
+                provider_id=provider_id,
+                query=query_template.format(provider_label=provider_label),
+                phase=phase,
+                count_key="deleted_rels_count",
+                total_key="rels",
+                deleted_key="deleted_rels",
+                initial_total=deleted_relationships,
+                batch_size=GRAPH_MUTATION_BATCH_SIZE,
+                drop_t0=drop_t0,
+            )
+            relationship_batches += phase_batches
+
+        deleted_nodes, node_batches = delete_batches(
+            session=session,
+            logger=logger,
+            log_target=log_target,
+            provider_id=provider_id,
+            query=NODE_DELETE_QUERY_TEMPLATE.format(
+                provider_label=provider_label,
+                provider_resource_label=PROVIDER_RESOURCE_LABEL,
+            ),
+            phase="node",
+            count_key="deleted_nodes_count",
+            total_key="nodes",
+            deleted_key="deleted_nodes",
+            initial_total=0,
+            batch_size=GRAPH_MUTATION_BATCH_SIZE,
+            drop_t0=drop_t0,
+        )
+        return deleted_relationships, relationship_batches, deleted_nodes, node_batches
 
     def has_provider_data(self, database: str, provider_id: str) -> bool:
         from api.attack_paths.database import GraphDatabaseQueryException
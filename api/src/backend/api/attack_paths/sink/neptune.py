@@ -25,8 +25,13 @@ from urllib.parse import urlsplit
 
 import neo4j
 import neo4j.exceptions
+from api.attack_paths.neo4j_codes import (
+    ACCESS_MODE_CODE,
+    CLIENT_STATEMENT_EXCEPTION_PREFIX,
+    READ_EXCEPTION_CODES,
+)
 from api.attack_paths.retryable_session import RetryableSession, RetryExhaustedError
-from api.attack_paths.sink.base import SinkDatabase
+from api.attack_paths.sink.base import SinkDatabase, stream_graph
 from api.attack_paths.sink.drop import (
     NODE_DELETE_QUERY_TEMPLATE,
     RELATIONSHIP_DELETE_QUERY_TEMPLATES,
@@ -61,11 +66,6 @@ MAX_CONNECTION_LIFETIME = env.int("NEPTUNE_MAX_CONNECTION_LIFETIME", default=360
 MAX_CONNECTION_POOL_SIZE = env.int("NEPTUNE_MAX_CONNECTION_POOL_SIZE", default=50)
 NEPTUNE_WRITE_RETRY_DELAY_SECONDS = 2
 
-READ_EXCEPTION_CODES = [
-    "Neo.ClientError.Statement.AccessMode",
-    "Neo.ClientError.Procedure.ProcedureNotFound",
-]
-CLIENT_STATEMENT_EXCEPTION_PREFIX = "Neo.ClientError.Statement."
 RETRYABLE_WRITE_ERROR_FRAGMENTS = (
     "Operation failed due to conflicting concurrent operations",
     "Operation terminated (deadline exceeded)",
@@ -231,6 +231,9 @@ class NeptuneSink(SinkDatabase):
                     NEPTUNE_WRITE_RETRY_DELAY_SECONDS if is_write_session else 0
                 ),
                 retry_context="Neptune write" if is_write_session else None,
+                max_retry_time_seconds=(
+                    None if is_write_session else READ_QUERY_TIMEOUT_SECONDS
+                ),
             )
             yield session_wrapper
 
@@ -248,7 +251,7 @@ class NeptuneSink(SinkDatabase):
                 and exc.code in READ_EXCEPTION_CODES
             ):
                 raise WriteQueryNotAllowedException(
-                    message="Read query not allowed", code=READ_EXCEPTION_CODES[0]
+                    message="Read query not allowed", code=ACCESS_MODE_CODE
                 )
 
             message = exc.message if exc.message is not None else str(exc)
@@ -274,7 +277,7 @@ class NeptuneSink(SinkDatabase):
                 result = tx.run(
                     cypher, parameters or {}, timeout=READ_QUERY_TIMEOUT_SECONDS
                 )
-                return result.graph()
+                return stream_graph(result)
 
             return session.execute_read(_run)
 
@@ -1,4 +1,6 @@
 import logging
+import threading
+import time
 from collections.abc import Iterable
 from typing import Any
 
@@ -20,14 +22,32 @@ from config.custom_logging import BackendLogger
 from config.env import env
 from rest_framework.exceptions import APIException, PermissionDenied, ValidationError
 from tasks.jobs.attack_paths.config import (
+    DYNAMIC_ISOLATION_PREFIXES,
     INTERNAL_LABELS,
     INTERNAL_PROPERTIES,
     get_provider_label,
-    is_dynamic_isolation_label,
 )
 
 logger = logging.getLogger(BackendLogger.API)
 
+# Label and property filtering run once per label / property key of every
+# returned element, so the config lists are frozen into shapes with C-level
+# membership / prefix checks
+_INTERNAL_LABELS = frozenset(INTERNAL_LABELS)
+_INTERNAL_PROPERTIES = frozenset(INTERNAL_PROPERTIES)
+_DYNAMIC_ISOLATION_PREFIXES = tuple(DYNAMIC_ISOLATION_PREFIXES)
+
+
+# Cartography schema metadata only changes when a provider is re-ingested, so
+# lookups are memoized per process for a short TTL
+CARTOGRAPHY_SCHEMA_CACHE_TTL_SECONDS = env.int(
+    "ATTACK_PATHS_SCHEMA_CACHE_TTL_SECONDS", default=300
+)
+CARTOGRAPHY_SCHEMA_CACHE_MAX_ENTRIES = 512
+
+_cartography_schema_cache: dict[tuple[str, str, str], tuple[float, dict[str, str]]] = {}
+_cartography_schema_cache_lock = threading.Lock()
+
 
 def _custom_query_timeout_ms() -> int:
     return env.int("ATTACK_PATHS_READ_QUERY_TIMEOUT_SECONDS", default=30) * 1000
@@ -40,8 +60,8 @@ def normalize_query_payload(raw_data):
     if not isinstance(raw_data, dict):  # Let the serializer handle this
         return raw_data
 
-    if "data" in raw_data and isinstance(raw_data.get("data"), dict):
-        data_section = raw_data.get("data") or {}
+    data_section = raw_data.get("data")
+    if isinstance(data_section, dict):
         attributes = data_section.get("attributes") or {}
         payload = {
             "id": attributes.get("id", data_section.get("id")),
@@ -62,9 +82,8 @@ def prepare_parameters(
     provider_uid: str,
     provider_id: str,
 ) -> dict[str, Any]:
-    parameters = dict(provided_parameters or {})
-    expected_names = {parameter.name for parameter in definition.parameters}
-    provided_names = set(parameters.keys())
+    expected_names = definition.expected_names
+    provided_names = set(provided_parameters or ())
 
     unexpected = provided_names - expected_names
     if unexpected:
@@ -84,22 +103,18 @@ def prepare_parameters(
         "provider_uid": str(provider_uid),
     }
 
-    for definition_parameter in definition.parameters:
-        raw_value = provided_parameters[definition_parameter.name]
+    for name, cast in definition.parameter_casts.items():
+        raw_value = provided_parameters[name]
 
         try:
-            casted_value = definition_parameter.cast(raw_value)
+            casted_value = cast(raw_value)
 
         except (ValueError, TypeError) as exc:
             raise ValidationError(
-                {
-                    "parameters": (
-                        f"Invalid value for parameter `{definition_parameter.name}`: {str(exc)}"
-                    )
-                }
+                {"parameters": f"Invalid value for parameter `{name}`: {str(exc)}"}
             )
 
-        clean_parameters[definition_parameter.name] = casted_value
+        clean_parameters[name] = casted_value
 
     return clean_parameters
 
@@ -156,8 +171,8 @@ def normalize_custom_query_payload(raw_data):
     if not isinstance(raw_data, dict):
         return raw_data
 
-    if "data" in raw_data and isinstance(raw_data.get("data"), dict):
-        data_section = raw_data.get("data") or {}
+    data_section = raw_data.get("data")
+    if isinstance(data_section, dict):
         attributes = data_section.get("attributes") or {}
         return {"query": attributes.get("query")}
 
@@ -193,8 +208,9 @@ def execute_custom_query(
 
     try:
         graph = backend.execute_read_query(database_name, cypher, None)
-        serialized = _serialize_graph(graph, provider_id)
-        return _truncate_graph(serialized)
+        return _serialize_graph(
+            graph, provider_id, max_nodes=graph_database.MAX_CUSTOM_QUERY_NODES
+        )
 
     except graph_database.ClientStatementException as exc:
         raise ValidationError({"query": exc.message})
@@ -217,6 +233,16 @@ def execute_custom_query(
 def get_cartography_schema(
     database_name: str, provider_id: str, scan: AttackPathsScan
 ) -> dict[str, str] | None:
+    cache_key = (
+        database_name,
+        provider_id,
+        str(getattr(scan, "sink_backend", None)),
+    )
+    now = time.monotonic()
+    cached = _cartography_schema_cache.get(cache_key)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
     try:
         backend = sink_module.get_backend_for_scan(scan)
         with backend.get_session(
@@ -230,6 +256,7 @@ def get_cartography_schema(
             "Unable to retrieve cartography schema due to a database error"
         )
 
+    # Misses are not cached so a provider's first ingest shows up immediately
     if not record:
         return None
 
@@ -237,7 +264,7 @@ def get_cartography_schema(
     version = record["module_version"]
     provider = module_name.split(":")[1]
 
-    return {
+    schema = {
         "id": f"{provider}-{version}",
         "provider": provider,
         "cartography_version": version,
@@ -245,73 +272,104 @@ def get_cartography_schema(
         "raw_schema_url": RAW_SCHEMA_URL.format(version=version, provider=provider),
     }
 
+    with _cartography_schema_cache_lock:
+        if len(_cartography_schema_cache) >= CARTOGRAPHY_SCHEMA_CACHE_MAX_ENTRIES:
+            # Dicts keep insertion order, so this evicts the oldest entry
+            _cartography_schema_cache.pop(next(iter(_cartography_schema_cache)))
+        _cartography_schema_cache[cache_key] = (
+            now + CARTOGRAPHY_SCHEMA_CACHE_TTL_SECONDS,
+            schema,
+        )
 
-# Private helpers
+    return schema
 
 
-def _truncate_graph(graph: dict[str, Any]) -> dict[str, Any]:
-    if graph["total_nodes"] > graph_database.MAX_CUSTOM_QUERY_NODES:
-        graph["truncated"] = True
+def clear_cartography_schema_cache() -> None:
+    with _cartography_schema_cache_lock:
+        _cartography_schema_cache.clear()
 
-        graph["nodes"] = graph["nodes"][: graph_database.MAX_CUSTOM_QUERY_NODES]
-        kept_node_ids = {node["id"] for node in graph["nodes"]}
 
-        graph["relationships"] = [
-            rel
-            for rel in graph["relationships"]
-            if rel["source"] in kept_node_ids and rel["target"] in kept_node_ids
-        ]
+# Private helpers
 
-    return graph
 
+def _serialize_graph(
+    graph: neo4j.graph.Graph, provider_id: str, max_nodes: int | None = None
+) -> dict[str, Any]:
+    """Serialize a Neo4j graph into the API payload, scoped to one provider.
 
-def _serialize_graph(graph, provider_id: str) -> dict[str, Any]:
+    When `max_nodes` is set, only the first `max_nodes` provider nodes are
+    serialized; the rest are counted in `total_nodes` and the payload is
+    flagged as `truncated`. Relationships touching a node past the cap are
+    dropped by the same endpoint check that drops cross-provider edges.
+    """
     provider_label = get_provider_label(provider_id)
-
-    nodes = []
-    kept_node_ids = set()
+    if max_nodes is None:
+        max_nodes = len(graph.nodes)
+
+    # Bound methods and helpers are hoisted into locals: both loops run once
+    # per graph element, so attribute lookups here dominate on large graphs
+    filter_labels = _filter_labels
+    serialize_properties = _serialize_properties
+
+    nodes: list[dict[str, Any]] = []
+    nodes_append = nodes.append
+    kept_node_ids: set[str] = set()
+    kept_add = kept_node_ids.add
+    total_nodes = 0
     for node in graph.nodes:
-        if provider_label not in node.labels:
+        labels = node.labels
+        if provider_label not in labels:
             continue
 
-        kept_node_ids.add(node.element_id)
-        nodes.append(
+        total_nodes += 1
+        if total_nodes > max_nodes:
+            continue
+
+        node_id = node.element_id
+        kept_add(node_id)
+        nodes_append(
             {
-                "id": node.element_id,
-                "labels": _filter_labels(node.labels),
-                "properties": _serialize_properties(node._properties),
+                "id": node_id,
+                "labels": filter_labels(labels),
+                "properties": serialize_properties(node._properties),
             },
         )
 
-    filtered_count = len(graph.nodes) - len(nodes)
+    filtered_count = len(graph.nodes) - total_nodes
     if filtered_count > 0:
         logger.debug(
             f"Filtered {filtered_count} nodes without provider label {provider_label}"
         )
 
-    relationships = []
-    for relationship in graph.relationships:
-        if (
-            relationship.start_node.element_id not in kept_node_ids
-            or relationship.end_node.element_id not in kept_node_ids
-        ):
+    # Each edge costs at most two set lookups, rejected on the source first;
+    # with no node kept (e.g. a result scoped to another provider) none can
+    # survive, so the walk is skipped outright
+    relationships: list[dict[str, Any]] = []
+    relationships_append = relationships.append
+    for relationship in graph.relationships if kept_node_ids else ():
+        source_id = relationship.start_node.element_id
+        if source_id not in kept_node_ids:
+            continue
+
+        target_id = relationship.end_node.element_id
+        if target_id not in kept_node_ids:
             continue
 
-        relationships.append(
+        relationships_append(
             {
                 "id": relationship.element_id,
                 "label": relationship.type,
-                "source": relationship.start_node.element_id,
-                "target": relationship.end_node.element_id,
-                "properties": _serialize_properties(relationship._properties),
+                "source": source_id,
+                "target": target_id,
+                "properties": serialize_properties(relationship._properties),
             },
         )
 
     return {
         "nodes": nodes,
         "relationships": relationships,
-        "total_nodes": len(nodes),
-        "truncated": False,
+        "total_nodes": total_nodes,
+        "truncated": total_nodes > len(nodes),
     }
 
 
@@ -319,34 +377,60 @@ def _filter_labels(labels: Iterable[str]) -> list[str]:
     return [
         label
         for label in labels
-        if label not in INTERNAL_LABELS and not is_dynamic_isolation_label(label)
+        if label not in _INTERNAL_LABELS
+        and not label.startswith(_DYNAMIC_ISOLATION_PREFIXES)
     ]
 
 
-def _serialize_properties(properties: dict[str, Any]) -> dict[str, Any]:
-    """Convert Neo4j property values into JSON-serializable primitives.
+# Property values that are already JSON-serializable and need no conversion
+_PRIMITIVE_TYPES = frozenset({str, int, float, bool, type(None)})
 
-    Filters out internal properties (Cartography metadata and provider
-    isolation fields) defined in INTERNAL_PROPERTIES.
-    """
 
-    def _serialize_value(value: Any) -> Any:
-        # Neo4j temporal and spatial values expose `to_native` returning Python primitives
-        if hasattr(value, "to_native") and callable(value.to_native):
-            return _serialize_value(value.to_native())
+def _serialize_value(value: Any) -> Any:
+    # Exact-type checks first: almost every property value is a primitive, and
+    # `type(...) in frozenset` is far cheaper than a failed `to_native` probe
+    value_type = type(value)
+    if value_type in _PRIMITIVE_TYPES:
+        return value
 
-        if isinstance(value, (list, tuple)):
-            return [_serialize_value(item) for item in value]
+    if value_type is list or value_type is tuple:
+        return [_serialize_value(item) for item in value]
 
-        if isinstance(value, dict):
-            return {key: _serialize_value(val) for key, val in value.items()}
+    if value_type is dict:
+        return {key: _serialize_value(val) for key, val in value.items()}
 
-        return value
+    # Neo4j temporal and spatial values expose `to_native` returning Python primitives
+    to_native = getattr(value, "to_native", None)
+    if callable(to_native):
+        return _serialize_value(to_native())
 
+    if isinstance(value, (list, tuple)):
+        return [_serialize_value(item) for item in value]
+
+    if isinstance(value, dict):
+        return {key: _serialize_value(val) for key, val in value.items()}
+
+    return value
+
+
+def _serialize_properties(properties: dict[str, Any]) -> dict[str, Any]:
+    """Convert Neo4j property values into JSON-serializable primitives.
+
+    Filters out internal properties (Cartography metadata and provider
+    isolation fields) defined in INTERNAL_PROPERTIES. Primitive values are
+    copied as-is without a `_serialize_value` call; only temporal, spatial and
+    container values take the conversion path.
+    """
+    if not properties:
+        return {}
+
+    internal_properties = _INTERNAL_PROPERTIES
+    primitive_types = _PRIMITIVE_TYPES
+    serialize_value = _serialize_value
     return {
-        key: _serialize_value(val)
+        key: val if type(val) in primitive_types else serialize_value(val)
         for key, val in properties.items()
-        if key not in INTERNAL_PROPERTIES
+        if key not in internal_properties
     }
 
 
@@ -386,16 +470,25 @@ def serialize_graph_as_text(graph: dict[str, Any]) -> str:
     nodes = graph.get("nodes", [])
     relationships = graph.get("relationships", [])
 
-    node_lookup = {node["id"]: node for node in nodes}
-
     lines = [f"## Nodes ({len(nodes)})"]
-    for node in nodes:
-        lines.append(f"- {_format_node_signature(node)}")
+    if relationships:
+        # A node is referenced once in its own line and once per incident edge,
+        # so each reference string is rendered a single time and reused
+        reference_lookup = {node["id"]: _format_node_reference(node) for node in nodes}
+        lines.extend(
+            f"- {_format_node_signature(node, reference_lookup[node['id']])}"
+            for node in nodes
+        )
+    else:
+        # Node-only results (e.g. inventory queries) never look a node up again
+        lines.extend(f"- {_format_node_signature(node)}" for node in nodes)
 
     lines.append("")
     lines.append(f"## Relationships ({len(relationships)})")
-    for rel in relationships:
-        lines.append(f"- {_format_relationship(rel, node_lookup)}")
+    if relationships:
+        lines.extend(
+            f"- {_format_relationship(rel, reference_lookup)}" for rel in relationships
+        )
 
     lines.append("")
     lines.append("## Summary")
@@ -405,10 +498,13 @@ def serialize_graph_as_text(graph: dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
-def _format_node_signature(node: dict[str, Any]) -> str:
+def _format_node_signature(node: dict[str, Any], reference: str | None = None) -> str:
     """
     Format a node as its reference followed by its properties.
 
+    `reference` is the pre-rendered `_format_node_reference` output, if the
+    caller already has it.
+
     Example::
 
         >>> _format_node_signature({"id": "n1", "labels": ["AWSRole"], "properties": {"name": "admin"}})
@@ -416,7 +512,8 @@ def _format_node_signature(node: dict[str, Any]) -> str:
         >>> _format_node_signature({"id": "n2", "labels": ["AWSAccount"], "properties": {}})
         'AWSAccount "n2"'
     """
-    reference = _format_node_reference(node)
+    if reference is None:
+        reference = _format_node_reference(node)
     properties = _format_properties(node.get("properties", {}))
 
     if properties:
@@ -438,22 +535,23 @@ def _format_node_reference(node: dict[str, Any]) -> str:
     return f'{labels} "{node["id"]}"'
 
 
-def _format_relationship(rel: dict[str, Any], node_lookup: dict[str, dict]) -> str:
+def _format_relationship(rel: dict[str, Any], reference_lookup: dict[str, str]) -> str:
     """
     Format a relationship as source -[LABEL (props)]-> target.
 
+    `reference_lookup` maps node ids to their `_format_node_reference` output.
+
     Example::
 
         >>> _format_relationship(
         ...     {"id": "r1", "label": "STS_ASSUMEROLE_ALLOW", "source": "n1", "target": "n2",
         ...      "properties": {"weight": 1}},
-        ...     {"n1": {"id": "n1", "labels": ["AWSRole"]},
-        ...      "n2": {"id": "n2", "labels": ["AWSRole"]}},
+        ...     {"n1": 'AWSRole "n1"', "n2": 'AWSRole "n2"'},
         ... )
         'AWSRole "n1" -[STS_ASSUMEROLE_ALLOW (weight: 1)]-> AWSRole "n2"'
     """
-    source = _format_node_reference(node_lookup[rel["source"]])
-    target = _format_node_reference(node_lookup[rel["target"]])
+    source = reference_lookup[rel["source"]]
+    target = reference_lookup[rel["target"]]
 
     props = _format_properties(rel.get("properties", {}))
     label = f"{rel['label']} {props}" if props else rel["label"]
@@ -477,7 +575,8 @@ def _format_properties(properties: dict[str, Any]) -> str:
     if not properties:
         return ""
 
-    parts = [f"{k}: {_format_value(v)}" for k, v in properties.items()]
+    format_value = _format_value
+    parts = [f"{k}: {format_value(v)}" for k, v in properties.items()]
     return f"({', '.join(parts)})"
 
 
@@ -498,21 +597,30 @@ def _format_value(value: Any) -> str:
         >>> _format_value(None)
         'null'
     """
-    if isinstance(value, str):
+    # Exact-type fast paths for the common leaves; subclasses fall through to
+    # the `isinstance` checks below
+    value_type = type(value)
+    if value_type is str:
         return f'"{value}"'
 
-    if isinstance(value, bool):
-        return str(value).lower()
+    if value_type is bool:
+        return "true" if value else "false"
+
+    if value_type is int or value_type is float:
+        return str(value)
+
+    if value is None:
+        return "null"
+
+    if isinstance(value, str):
+        return f'"{value}"'
 
     if isinstance(value, (list, tuple)):
-        inner = ", ".join(_format_value(v) for v in value)
+        inner = ", ".join([_format_value(v) for v in value])
         return f"[{inner}]"
 
     if isinstance(value, dict):
-        inner = ", ".join(f"{k}: {_format_value(v)}" for k, v in value.items())
+        inner = ", ".join([f"{k}: {_format_value(v)}" for k, v in value.items()])
         return f"{{{inner}}}"
 
-    if value is None:
-        return "null"
-
     return str(value)
@@ -0,0 +1,24 @@
+from django.contrib.postgres.operations import RemoveIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("api", "0097_attack_paths_scan_db_defaults"),
+    ]
+
+    # Both are left-prefixes of a wider index on the same table:
+    # (tenant_id, scan_id, service) of rss_tenant_scan_svc_type_idx and
+    # (tenant_id, scan_id, region) of rss_tenant_scan_reg_svc_idx.
+    operations = [
+        RemoveIndexConcurrently(
+            model_name="resourcescansummary",
+            name="rss_tenant_scan_svc_idx",
+        ),
+        RemoveIndexConcurrently(
+            model_name="resourcescansummary",
+            name="rss_tenant_scan_reg_idx",
+        ),
+    ]
@@ -0,0 +1,29 @@
+from django.contrib.postgres.operations import (
+    AddIndexConcurrently,
+    RemoveIndexConcurrently,
+)
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("api", "0098_drop_redundant_resource_scan_summary_indexes"),
+    ]
+
+    # The new index keeps the (tenant_id, scan_id, service) prefix of the one it
+    # replaces, so it is built before rss_tenant_scan_svc_type_idx is dropped.
+    operations = [
+        AddIndexConcurrently(
+            model_name="resourcescansummary",
+            index=models.Index(
+                fields=["tenant_id", "scan_id", "service", "region", "resource_type"],
+                name="rss_tenant_scan_dims_idx",
+            ),
+        ),
+        RemoveIndexConcurrently(
+            model_name="resourcescansummary",
+            name="rss_tenant_scan_svc_type_idx",
+        ),
+    ]
@@ -0,0 +1,75 @@
+"""
+Replace the B-tree on `resource_scan_summaries.scan_id` with a BRIN index.
+
+Every tenant-scoped lookup is served by the composite `(tenant_id, scan_id, ...)`
+indexes; the single-column index only helps scan-wide reads, which a BRIN over
+the time-ordered UUIDv7 covers at a fraction of the size and insert cost.
+"""
+
+import uuid6
+from django.contrib.postgres.indexes import BrinIndex
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+def drop_resource_scan_summary_scan_id_index(apps, schema_editor):
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT idx_ns.nspname, idx.relname
+            FROM pg_class tbl
+            JOIN pg_namespace tbl_ns ON tbl_ns.oid = tbl.relnamespace
+            JOIN pg_index i ON i.indrelid = tbl.oid
+            JOIN pg_class idx ON idx.oid = i.indexrelid
+            JOIN pg_namespace idx_ns ON idx_ns.oid = idx.relnamespace
+            JOIN pg_am am ON am.oid = idx.relam
+            JOIN pg_attribute a
+                ON a.attrelid = tbl.oid
+                AND a.attnum = (i.indkey::int[])[0]
+            WHERE tbl_ns.nspname = ANY (current_schemas(false))
+              AND tbl.relname = %s
+              AND i.indnatts = 1
+              AND am.amname = 'btree'
+              AND a.attname = %s
+            """,
+            ["resource_scan_summaries", "scan_id"],
+        )
+        row = cursor.fetchone()
+
+    if not row:
+        return
+
+    schema_name, index_name = row
+    quote_name = schema_editor.connection.ops.quote_name
+    qualified_name = f"{quote_name(schema_name)}.{quote_name(index_name)}"
+    schema_editor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {qualified_name};")
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("api", "0099_resource_scan_summary_dims_index"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="resourcescansummary",
+            index=BrinIndex(fields=["scan_id"], name="rss_scan_id_brin_idx"),
+        ),
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunPython(
+                    drop_resource_scan_summary_scan_id_index,
+                    reverse_code=migrations.RunPython.noop,
+                ),
+            ],
+            state_operations=[
+                migrations.AlterField(
+                    model_name="resourcescansummary",
+                    name="scan_id",
+                    field=models.UUIDField(default=uuid6.uuid7),
+                ),
+            ],
+        ),
+    ]
@@ -39,7 +39,7 @@ from defusedxml import ElementTree as ET
 from django.conf import settings
 from django.contrib.auth.models import AbstractBaseUser
 from django.contrib.postgres.fields import ArrayField
-from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.indexes import BrinIndex, GinIndex, OpClass
 from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.contrib.sites.models import Site
 from django.core.exceptions import ValidationError
@@ -2284,7 +2284,7 @@ class SAMLConfiguration(RowLevelSecurityProtectedModel):
 
 
 class ResourceScanSummary(RowLevelSecurityProtectedModel):
-    scan_id = models.UUIDField(default=uuid7, db_index=True)
+    scan_id = models.UUIDField(default=uuid7)
     resource_id = models.UUIDField(default=uuid4)
     service = models.CharField(max_length=100)
     region = models.CharField(max_length=100)
@@ -2295,15 +2295,8 @@ class ResourceScanSummary(RowLevelSecurityProtectedModel):
         unique_together = (("tenant_id", "scan_id", "resource_id"),)
 
         indexes = [
-            # Single-dimension lookups:
-            models.Index(
-                fields=["tenant_id", "scan_id", "service"],
-                name="rss_tenant_scan_svc_idx",
-            ),
-            models.Index(
-                fields=["tenant_id", "scan_id", "region"],
-                name="rss_tenant_scan_reg_idx",
-            ),
+            # Single-dimension lookups. Service and region are served by the
+            # leading columns of the dims and reg_svc indexes below
             models.Index(
                 fields=["tenant_id", "scan_id", "resource_type"],
                 name="rss_tenant_scan_type_idx",
@@ -2313,14 +2306,19 @@ class ResourceScanSummary(RowLevelSecurityProtectedModel):
                 fields=["tenant_id", "scan_id", "region", "service"],
                 name="rss_tenant_scan_reg_svc_idx",
             ),
-            models.Index(
-                fields=["tenant_id", "scan_id", "service", "resource_type"],
-                name="rss_tenant_scan_svc_type_idx",
-            ),
             models.Index(
                 fields=["tenant_id", "scan_id", "region", "resource_type"],
                 name="rss_tenant_scan_reg_type_idx",
             ),
+            # Holds every metadata dimension, so the DISTINCT service / region /
+            # type reads behind /resources/metadata are index-only scans
+            models.Index(
+                fields=["tenant_id", "scan_id", "service", "region", "resource_type"],
+                name="rss_tenant_scan_dims_idx",
+            ),
+            # scan_id is a UUIDv7 and each scan's rows are bulk-inserted
+            # together, so block ranges summarize it well for cross-tenant scans
+            BrinIndex(fields=["scan_id"], name="rss_scan_id_brin_idx"),
         ]
 
         constraints = [
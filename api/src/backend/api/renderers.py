@@ -1,5 +1,3 @@
-from contextlib import nullcontext
-
 from api.db_utils import rls_transaction
 from rest_framework.renderers import BaseRenderer
 from rest_framework_json_api.renderers import JSONRenderer
@@ -10,12 +8,13 @@ class PlainTextRenderer(BaseRenderer):
     format = "text"
 
     def render(self, data, accepted_media_type=None, renderer_context=None):
-        encoding = self.charset or "utf-8"
-        if isinstance(data, str):
-            return data.encode(encoding)
+        # Exact type check: responses are plain `str`; subclasses still encode
+        # correctly through the `str(data)` fallback
+        if type(data) is str:
+            return data.encode(self.charset)
         if data is None:
             return b""
-        return str(data).encode(encoding)
+        return str(data).encode(self.charset)
 
 
 class APIJSONRenderer(JSONRenderer):
@@ -24,14 +23,12 @@ class APIJSONRenderer(JSONRenderer):
     def render(self, data, accepted_media_type=None, renderer_context=None):
         request = renderer_context.get("request") if renderer_context else None
         tenant_id = getattr(request, "tenant_id", None) if request else None
-        db_alias = getattr(request, "db_alias", None) if request else None
-        include_param_present = "include" in request.query_params if request else False
-
-        # Use rls_transaction if needed for included resources, otherwise do nothing
-        context_manager = (
-            rls_transaction(tenant_id, using=db_alias)
-            if tenant_id and include_param_present
-            else nullcontext()
-        )
-        with context_manager:
+
+        # Only included resources are fetched while rendering, so the RLS
+        # transaction is opened just for tenant requests that ask for them
+        if not tenant_id or "include" not in request.query_params:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        db_alias = getattr(request, "db_alias", None)
+        with rls_transaction(tenant_id, using=db_alias):
             return super().render(data, accepted_media_type, renderer_context)
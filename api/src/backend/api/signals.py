@@ -1,3 +1,5 @@
+import logging
+
 from api.db_router import MainRouter
 from api.db_utils import delete_related_daily_task
 from api.models import (
@@ -9,12 +11,14 @@ from api.models import (
     User,
 )
 from celery import states
-from celery.signals import before_task_publish
+from celery.signals import before_task_publish, worker_process_shutdown
 from config.celery import celery_app
 from django.db.models.signals import post_delete, pre_delete
 from django.dispatch import receiver
 from django_celery_results.backends.database import DatabaseBackend
 
+logger = logging.getLogger(__name__)
+
 
 def create_task_result_on_publish(sender=None, headers=None, **kwargs):  # noqa: F841
     """Celery signal to store TaskResult entries when tasks reach the broker."""
@@ -35,6 +39,28 @@ before_task_publish.connect(
 )
 
 
+def close_graph_drivers_on_worker_shutdown(**kwargs):  # noqa: F841
+    """Close the attack-paths drivers when a Celery pool process exits.
+
+    Pool processes leave through `os._exit`, which skips `atexit`, so without
+    this their Bolt connections stay open server-side until keepalive expires.
+    """
+    from api.attack_paths import database as graph_database
+
+    try:
+        graph_database.close_driver()
+    except Exception:
+        logger.warning(
+            "Failed to close attack-paths drivers on shutdown", exc_info=True
+        )
+
+
+worker_process_shutdown.connect(
+    close_graph_drivers_on_worker_shutdown,
+    dispatch_uid="close_graph_drivers_on_worker_shutdown",
+)
+
+
 @receiver(post_delete, sender=Provider)
 def delete_provider_scan_task(sender, instance, **kwargs):  # noqa: F841
     # Delete the associated periodic task when the provider is deleted
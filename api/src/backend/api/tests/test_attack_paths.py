@@ -6,6 +6,7 @@ import neo4j.exceptions
 import pytest
 from api.attack_paths import database as graph_database
 from api.attack_paths import views_helpers
+from api.attack_paths.queries.types import AttackPathsQueryDefinition
 from rest_framework.exceptions import APIException, PermissionDenied, ValidationError
 from tasks.jobs.attack_paths.config import (
     PROVIDER_ELEMENT_ID_PROPERTY,
@@ -18,6 +19,28 @@ def _make_neo4j_error(message, code):
     return neo4j.exceptions.Neo4jError._hydrate_neo4j(code=code, message=message)
 
 
+@pytest.fixture(scope="module")
+def aws_rds_definition():
+    """Parameterless definition shared by the execute_query tests; never mutated."""
+    return AttackPathsQueryDefinition(
+        id="aws-rds",
+        name="RDS",
+        short_description="Short desc",
+        description="",
+        provider="aws",
+        cypher="MATCH (n) RETURN n",
+        parameters=[],
+    )
+
+
+@pytest.fixture
+def views_logger(monkeypatch):
+    """Replace the views_helpers logger so error logging can be asserted."""
+    mock_logger = MagicMock()
+    monkeypatch.setattr(views_helpers, "logger", mock_logger)
+    return mock_logger
+
+
 def test_normalize_query_payload_extracts_attributes_section():
     payload = {
         "data": {
@@ -39,6 +62,11 @@ def test_normalize_query_payload_passthrough_for_non_dict():
     assert views_helpers.normalize_query_payload(sentinel) is sentinel
 
 
+def test_normalize_query_payload_passthrough_for_non_object_data():
+    payload = {"data": ["aws-rds"], "id": "aws-rds"}
+    assert views_helpers.normalize_query_payload(payload) is payload
+
+
 def test_prepare_parameters_includes_provider_and_casts(
     attack_paths_query_definition_factory,
 ):
@@ -91,19 +119,21 @@ def test_prepare_parameters_validates_cast(
     assert "Invalid value" in str(exc.value)
 
 
-def test_execute_query_serializes_graph(
+def test_query_definition_caches_parameter_lookups(
     attack_paths_query_definition_factory,
+):
+    definition = attack_paths_query_definition_factory()
+
+    assert definition.expected_names == frozenset({"limit"})
+    assert definition.parameter_casts == {"limit": definition.parameters[0].cast}
+    assert definition.parameter_casts is definition.parameter_casts
+
+
+def test_execute_query_serializes_graph(
+    aws_rds_definition,
     attack_paths_graph_stub_classes,
     sink_backend_stub,
 ):
-    definition = attack_paths_query_definition_factory(
-        id="aws-rds",
-        name="RDS",
-        short_description="Short desc",
-        description="",
-        cypher="MATCH (n) RETURN n",
-        parameters=[],
-    )
     parameters = {"provider_uid": "123"}
 
     provider_id = "test-provider-123"
@@ -131,23 +161,19 @@ def test_execute_query_serializes_graph(
     )
     graph = SimpleNamespace(nodes=[node, node_2], relationships=[relationship])
 
-    graph_result = MagicMock()
-    graph_result.nodes = graph.nodes
-    graph_result.relationships = graph.relationships
-
     database_name = "db-tenant-test-tenant-id"
 
-    sink_backend_stub.execute_read_query.return_value = graph_result
+    sink_backend_stub.execute_read_query.return_value = graph
     result = views_helpers.execute_query(
         database_name,
-        definition,
+        aws_rds_definition,
         parameters,
         provider_id=provider_id,
         scan=MagicMock(is_migrated=False, sink_backend="neo4j"),
     )
 
     sink_backend_stub.execute_read_query.assert_called_once_with(
-        database_name, definition.cypher, parameters
+        database_name, aws_rds_definition.cypher, parameters
     )
     assert result["nodes"][0]["id"] == "node-1"
     assert result["nodes"][0]["properties"]["complex"]["items"][0] == "value"
@@ -173,9 +199,7 @@ def test_execute_query_injects_provider_label_when_migrated(
     plabel = get_provider_label(provider_id)
     parameters = {"provider_uid": "123"}
 
-    graph_result = MagicMock()
-    graph_result.nodes = []
-    graph_result.relationships = []
+    graph_result = SimpleNamespace(nodes=[], relationships=[])
     sink_backend_stub.execute_read_query.return_value = graph_result
 
     # Injection is gated on `is_migrated`, not the sink (it is a pure string
@@ -218,9 +242,7 @@ def test_execute_query_does_not_inject_label_when_deprecated(
     )
     parameters = {"provider_uid": "123"}
 
-    graph_result = MagicMock()
-    graph_result.nodes = []
-    graph_result.relationships = []
+    graph_result = SimpleNamespace(nodes=[], relationships=[])
     sink_backend_stub.execute_read_query.return_value = graph_result
 
     views_helpers.execute_query(
@@ -237,48 +259,32 @@ def test_execute_query_does_not_inject_label_when_deprecated(
 
 
 def test_execute_query_wraps_graph_errors(
-    attack_paths_query_definition_factory,
+    aws_rds_definition,
     sink_backend_stub,
+    views_logger,
 ):
-    definition = attack_paths_query_definition_factory(
-        id="aws-rds",
-        name="RDS",
-        short_description="Short desc",
-        description="",
-        cypher="MATCH (n) RETURN n",
-        parameters=[],
-    )
     database_name = "db-tenant-test-tenant-id"
     parameters = {"provider_uid": "123"}
 
     sink_backend_stub.execute_read_query.side_effect = (
         graph_database.GraphDatabaseQueryException("boom")
     )
-    with patch("api.attack_paths.views_helpers.logger") as mock_logger:
-        with pytest.raises(APIException):
-            views_helpers.execute_query(
-                database_name,
-                definition,
-                parameters,
-                provider_id="test-provider-123",
-                scan=MagicMock(is_migrated=False, sink_backend="neo4j"),
-            )
+    with pytest.raises(APIException):
+        views_helpers.execute_query(
+            database_name,
+            aws_rds_definition,
+            parameters,
+            provider_id="test-provider-123",
+            scan=MagicMock(is_migrated=False, sink_backend="neo4j"),
+        )
 
-    mock_logger.error.assert_called_once()
+    views_logger.error.assert_called_once()
 
 
 def test_execute_query_raises_permission_denied_on_read_only(
-    attack_paths_query_definition_factory,
+    aws_rds_definition,
     sink_backend_stub,
 ):
-    definition = attack_paths_query_definition_factory(
-        id="aws-rds",
-        name="RDS",
-        short_description="Short desc",
-        description="",
-        cypher="MATCH (n) RETURN n",
-        parameters=[],
-    )
     database_name = "db-tenant-test-tenant-id"
     parameters = {"provider_uid": "123"}
 
@@ -291,7 +297,7 @@ def test_execute_query_raises_permission_denied_on_read_only(
     with pytest.raises(PermissionDenied):
         views_helpers.execute_query(
             database_name,
-            definition,
+            aws_rds_definition,
             parameters,
             provider_id="test-provider-123",
             scan=MagicMock(is_migrated=False, sink_backend="neo4j"),
@@ -445,6 +451,36 @@ def test_serialize_properties_filters_internal_fields():
     assert result == {"name": "prod"}
 
 
+def test_serialize_properties_converts_native_and_nested_values(
+    attack_paths_graph_stub_classes,
+):
+    native = attack_paths_graph_stub_classes.NativeValue
+
+    properties = {
+        "name": "prod",
+        "count": 3,
+        "ratio": 0.5,
+        "enabled": True,
+        "missing": None,
+        "ports": (80, 443),
+        "created": native("2024-01-01"),
+        "tags": {"env": native("prod"), "owners": [native("alice"), "bob"]},
+    }
+
+    result = views_helpers._serialize_properties(properties)
+
+    assert result == {
+        "name": "prod",
+        "count": 3,
+        "ratio": 0.5,
+        "enabled": True,
+        "missing": None,
+        "ports": [80, 443],
+        "created": "2024-01-01",
+        "tags": {"env": "prod", "owners": ["alice", "bob"]},
+    }
+
+
 def test_filter_labels_strips_dynamic_isolation_labels():
     labels = ["AWSRole", "_Tenant_abc123", "_Provider_def456", "_ProviderResource"]
 
@@ -539,9 +575,7 @@ def test_execute_custom_query_serializes_graph(
         "rel-1", "OWNS", node_1, node_2, {}
     )
 
-    graph_result = MagicMock()
-    graph_result.nodes = [node_1, node_2]
-    graph_result.relationships = [relationship]
+    graph_result = SimpleNamespace(nodes=[node_1, node_2], relationships=[relationship])
 
     sink_backend_stub.execute_read_query.return_value = graph_result
     result = views_helpers.execute_custom_query(
@@ -563,9 +597,7 @@ def test_execute_custom_query_serializes_graph(
 
 
 def test_execute_custom_query_adds_timeout_for_neptune_scan(sink_backend_stub):
-    graph_result = MagicMock()
-    graph_result.nodes = []
-    graph_result.relationships = []
+    graph_result = SimpleNamespace(nodes=[], relationships=[])
     sink_backend_stub.execute_read_query.return_value = graph_result
 
     with patch(
@@ -599,34 +631,37 @@ def test_execute_custom_query_raises_permission_denied_on_write(sink_backend_stu
         )
 
 
-def test_execute_custom_query_wraps_graph_errors(sink_backend_stub):
+def test_execute_custom_query_wraps_graph_errors(sink_backend_stub, views_logger):
     sink_backend_stub.execute_read_query.side_effect = (
         graph_database.GraphDatabaseQueryException("boom")
     )
-    with patch("api.attack_paths.views_helpers.logger") as mock_logger:
-        with pytest.raises(APIException):
-            views_helpers.execute_custom_query(
-                "db-tenant-test",
-                "MATCH (n) RETURN n",
-                "provider-1",
-                scan=MagicMock(is_migrated=False, sink_backend="neo4j"),
-            )
+    with pytest.raises(APIException):
+        views_helpers.execute_custom_query(
+            "db-tenant-test",
+            "MATCH (n) RETURN n",
+            "provider-1",
+            scan=MagicMock(is_migrated=False, sink_backend="neo4j"),
+        )
 
-    mock_logger.error.assert_called_once()
+    views_logger.error.assert_called_once()
 
 
-# -- _truncate_graph ----------------------------------------------------------
+# -- _serialize_graph truncation ---------------------------------------------
 
 
-def test_truncate_graph_no_truncation_needed():
-    graph = {
-        "nodes": [{"id": f"n{i}"} for i in range(5)],
-        "relationships": [{"id": "r1", "source": "n0", "target": "n1"}],
-        "total_nodes": 5,
-        "truncated": False,
-    }
+def test_serialize_graph_no_truncation_needed(attack_paths_graph_stub_classes):
+    provider_id = "provider-keep"
+    plabel = get_provider_label(provider_id)
+    nodes = [
+        attack_paths_graph_stub_classes.Node(f"n{i}", ["AWSAccount", plabel], {})
+        for i in range(5)
+    ]
+    relationship = attack_paths_graph_stub_classes.Relationship(
+        "r1", "OWNS", nodes[0], nodes[1], {}
+    )
+    graph = SimpleNamespace(nodes=nodes, relationships=[relationship])
 
-    result = views_helpers._truncate_graph(graph)
+    result = views_helpers._serialize_graph(graph, provider_id, max_nodes=5)
 
     assert result["truncated"] is False
     assert result["total_nodes"] == 5
@@ -634,39 +669,80 @@ def test_truncate_graph_no_truncation_needed():
     assert len(result["relationships"]) == 1
 
 
-def test_truncate_graph_truncates_nodes_and_removes_orphan_relationships():
-    with patch.object(graph_database, "MAX_CUSTOM_QUERY_NODES", 3):
-        graph = {
-            "nodes": [{"id": f"n{i}"} for i in range(5)],
-            "relationships": [
-                {"id": "r1", "source": "n0", "target": "n1"},
-                {"id": "r2", "source": "n0", "target": "n4"},
-                {"id": "r3", "source": "n3", "target": "n4"},
-            ],
-            "total_nodes": 5,
-            "truncated": False,
-        }
+def test_serialize_graph_truncates_nodes_and_removes_orphan_relationships(
+    attack_paths_graph_stub_classes,
+):
+    provider_id = "provider-keep"
+    plabel = get_provider_label(provider_id)
+    other_label = get_provider_label("provider-other")
+    nodes = [
+        attack_paths_graph_stub_classes.Node(f"n{i}", ["AWSAccount", plabel], {})
+        for i in range(5)
+    ]
+    # Nodes from another provider neither count towards the cap nor the total
+    foreign = attack_paths_graph_stub_classes.Node(
+        "x0", ["AWSAccount", other_label], {}
+    )
+    relationships = [
+        attack_paths_graph_stub_classes.Relationship(
+            "r1", "OWNS", nodes[0], nodes[1], {}
+        ),
+        attack_paths_graph_stub_classes.Relationship(
+            "r2", "OWNS", nodes[0], nodes[4], {}
+        ),
+        attack_paths_graph_stub_classes.Relationship(
+            "r3", "OWNS", nodes[3], nodes[4], {}
+        ),
+    ]
+    graph = SimpleNamespace(nodes=[foreign, *nodes], relationships=relationships)
 
-        result = views_helpers._truncate_graph(graph)
+    result = views_helpers._serialize_graph(graph, provider_id, max_nodes=3)
 
     assert result["truncated"] is True
     assert result["total_nodes"] == 5
-    assert len(result["nodes"]) == 3
-    assert {n["id"] for n in result["nodes"]} == {"n0", "n1", "n2"}
+    assert [n["id"] for n in result["nodes"]] == ["n0", "n1", "n2"]
     # r1 kept (both endpoints in n0-n2), r2 and r3 dropped (n4 not in kept set)
-    assert len(result["relationships"]) == 1
-    assert result["relationships"][0]["id"] == "r1"
+    assert [r["id"] for r in result["relationships"]] == ["r1"]
 
 
-def test_truncate_graph_empty_graph():
-    graph = {"nodes": [], "relationships": [], "total_nodes": 0, "truncated": False}
+def test_serialize_graph_truncation_empty_graph():
+    graph = SimpleNamespace(nodes=[], relationships=[])
 
-    result = views_helpers._truncate_graph(graph)
+    result = views_helpers._serialize_graph(graph, "provider-keep", max_nodes=3)
 
-    assert result["truncated"] is False
-    assert result["total_nodes"] == 0
-    assert result["nodes"] == []
-    assert result["relationships"] == []
+    assert result == {
+        "nodes": [],
+        "relationships": [],
+        "total_nodes": 0,
+        "truncated": False,
+    }
+
+
+def test_execute_custom_query_truncates_to_max_nodes(
+    attack_paths_graph_stub_classes,
+    sink_backend_stub,
+):
+    provider_id = "test-provider-123"
+    plabel = get_provider_label(provider_id)
+    nodes = [
+        attack_paths_graph_stub_classes.Node(f"n{i}", ["AWSAccount", plabel], {})
+        for i in range(4)
+    ]
+    sink_backend_stub.execute_read_query.return_value = SimpleNamespace(
+        nodes=nodes, relationships=[]
+    )
+
+    with patch.object(graph_database, "MAX_CUSTOM_QUERY_NODES", 2):
+        result = views_helpers.execute_custom_query(
+            "db-tenant-test",
+            "MATCH (n) RETURN n",
+            provider_id,
+            scan=MagicMock(is_migrated=False, sink_backend="neo4j"),
+        )
+
+    assert result["truncated"] is True
+    assert result["total_nodes"] == 4
+    assert [n["id"] for n in result["nodes"]] == ["n0", "n1"]
 
 
 # -- execute_read_query read-only enforcement ---------------------------------
@@ -704,7 +780,7 @@ def mock_neo4j_session():
 
 
 def test_execute_read_query_succeeds_with_select(mock_neo4j_session):
-    mock_graph = MagicMock(spec=neo4j.graph.Graph)
+    mock_graph = object()
     mock_neo4j_session.execute_read.return_value = mock_graph
 
     result = graph_database.execute_read_query(
@@ -715,43 +791,23 @@ def test_execute_read_query_succeeds_with_select(mock_neo4j_session):
     assert result is mock_graph
 
 
-def test_execute_read_query_rejects_create(mock_neo4j_session):
-    mock_neo4j_session.execute_read.side_effect = _make_neo4j_error(
-        "Writing in read access mode not allowed",
-        "Neo.ClientError.Statement.AccessMode",
-    )
-
-    with pytest.raises(graph_database.WriteQueryNotAllowedException):
-        graph_database.execute_read_query(
-            database="test-db",
-            cypher="CREATE (n:Node {name: 'test'}) RETURN n",
-        )
-
-
-def test_execute_read_query_rejects_update(mock_neo4j_session):
-    mock_neo4j_session.execute_read.side_effect = _make_neo4j_error(
-        "Writing in read access mode not allowed",
-        "Neo.ClientError.Statement.AccessMode",
-    )
-
-    with pytest.raises(graph_database.WriteQueryNotAllowedException):
-        graph_database.execute_read_query(
-            database="test-db",
-            cypher="MATCH (n:Node) SET n.name = 'updated' RETURN n",
-        )
-
-
-def test_execute_read_query_rejects_delete(mock_neo4j_session):
+@pytest.mark.parametrize(
+    "cypher",
+    [
+        "CREATE (n:Node {name: 'test'}) RETURN n",
+        "MATCH (n:Node) SET n.name = 'updated' RETURN n",
+        "MATCH (n:Node) DELETE n",
+    ],
+    ids=["create", "set", "delete"],
+)
+def test_execute_read_query_rejects_writes(mock_neo4j_session, cypher):
     mock_neo4j_session.execute_read.side_effect = _make_neo4j_error(
         "Writing in read access mode not allowed",
         "Neo.ClientError.Statement.AccessMode",
     )
 
     with pytest.raises(graph_database.WriteQueryNotAllowedException):
-        graph_database.execute_read_query(
-            database="test-db",
-            cypher="MATCH (n:Node) DELETE n",
-        )
+        graph_database.execute_read_query(database="test-db", cypher=cypher)
 
 
 @pytest.mark.parametrize(
@@ -765,7 +821,7 @@ def test_execute_read_query_rejects_delete(mock_neo4j_session):
 def test_execute_read_query_succeeds_with_apoc_virtual_create(
     mock_neo4j_session, cypher
 ):
-    mock_graph = MagicMock(spec=neo4j.graph.Graph)
+    mock_graph = object()
     mock_neo4j_session.execute_read.return_value = mock_graph
 
     result = graph_database.execute_read_query(database="test-db", cypher=cypher)
@@ -794,6 +850,13 @@ def test_execute_read_query_rejects_apoc_real_create(mock_neo4j_session, cypher)
 # -- get_cartography_schema ---------------------------------------------------
 
 
+@pytest.fixture(autouse=True)
+def clear_cartography_schema_cache():
+    views_helpers.clear_cartography_schema_cache()
+    yield
+    views_helpers.clear_cartography_schema_cache()
+
+
 @pytest.fixture
 def mock_schema_session():
     """Mock the routed sink backend session for cartography schema tests."""
@@ -834,6 +897,35 @@ def test_get_cartography_schema_returns_urls(mock_schema_session):
     assert "/aws/" in result["raw_schema_url"]
 
 
+def test_get_cartography_schema_caches_result_per_provider(mock_schema_session):
+    mock_session, mock_result = mock_schema_session
+    mock_result.single.return_value = {
+        "module_name": "cartography:aws",
+        "module_version": "0.129.0",
+    }
+    scan = MagicMock(sink_backend="neo4j")
+
+    first = views_helpers.get_cartography_schema("db-tenant-test", "provider-123", scan)
+    second = views_helpers.get_cartography_schema(
+        "db-tenant-test", "provider-123", scan
+    )
+    views_helpers.get_cartography_schema("db-tenant-test", "provider-456", scan)
+
+    assert first == second
+    assert mock_session.run.call_count == 2
+
+
+def test_get_cartography_schema_does_not_cache_missing_data(mock_schema_session):
+    mock_session, mock_result = mock_schema_session
+    mock_result.single.return_value = None
+    scan = MagicMock(sink_backend="neo4j")
+
+    views_helpers.get_cartography_schema("db-tenant-test", "provider-123", scan)
+    views_helpers.get_cartography_schema("db-tenant-test", "provider-123", scan)
+
+    assert mock_session.run.call_count == 2
+
+
 def test_get_cartography_schema_returns_none_when_no_data(mock_schema_session):
     _, mock_result = mock_schema_session
     mock_result.single.return_value = None
@@ -870,21 +962,17 @@ def test_get_cartography_schema_extracts_provider(
     assert result["provider"] == expected_provider
 
 
-def test_get_cartography_schema_wraps_database_error():
+def test_get_cartography_schema_wraps_database_error(monkeypatch, views_logger):
     mock_backend = MagicMock()
     mock_backend.get_session.side_effect = graph_database.GraphDatabaseQueryException(
         "boom"
     )
-    with (
-        patch(
-            "api.attack_paths.views_helpers.sink_module.get_backend_for_scan",
-            return_value=mock_backend,
-        ),
-        patch("api.attack_paths.views_helpers.logger") as mock_logger,
-    ):
-        with pytest.raises(APIException):
-            views_helpers.get_cartography_schema(
-                "db-tenant-test", "provider-123", MagicMock(sink_backend="neo4j")
-            )
+    monkeypatch.setattr(
+        views_helpers.sink_module, "get_backend_for_scan", lambda _: mock_backend
+    )
+    with pytest.raises(APIException):
+        views_helpers.get_cartography_schema(
+            "db-tenant-test", "provider-123", MagicMock(sink_backend="neo4j")
+        )
 
-    mock_logger.error.assert_called_once()
+    views_logger.error.assert_called_once()
@@ -7,9 +7,13 @@ contract is routing by database-name prefix and the public exception
 hierarchy; sink-internal behavior is exercised in `test_sink.py`.
 """
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
 import api.attack_paths.database as db_module
+import api.attack_paths.ingest.driver as ingest_driver
 import pytest
 
 
@@ -238,3 +242,96 @@ class TestRoutingByDatabasePrefix:
 
         assert result is sentinel
         mock_ingest.get_session.assert_not_called()
+
+
+class TestIngestDriverPool:
+    """The temp-database driver is a pooled process-wide singleton."""
+
+    @pytest.fixture
+    def ingest_settings(self, settings, monkeypatch):
+        settings.DATABASES = {
+            **settings.DATABASES,
+            "neo4j": {
+                "HOST": "localhost",
+                "PORT": "7687",
+                "USER": "neo4j",
+                "PASSWORD": "pw",
+            },
+        }
+        monkeypatch.setattr(ingest_driver, "_driver", None)
+        monkeypatch.setattr(ingest_driver.atexit, "register", MagicMock())
+
+    @patch("api.attack_paths.ingest.driver.neo4j.GraphDatabase.driver")
+    def test_init_driver_passes_pool_config(self, mock_driver, ingest_settings):
+        ingest_driver.init_driver()
+
+        mock_driver.assert_called_once()
+        driver_kwargs = mock_driver.call_args.kwargs
+        assert (
+            driver_kwargs["max_connection_pool_size"]
+            == ingest_driver.MAX_CONNECTION_POOL_SIZE
+        )
+        assert (
+            driver_kwargs["connection_acquisition_timeout"]
+            == ingest_driver.CONN_ACQUISITION_TIMEOUT
+        )
+        assert (
+            driver_kwargs["max_connection_lifetime"]
+            == ingest_driver.MAX_CONNECTION_LIFETIME
+        )
+        # Sync writes keep the driver's default retry budget; only reads are capped
+        assert "max_transaction_retry_time" not in driver_kwargs
+
+    @patch("api.attack_paths.ingest.driver.neo4j.GraphDatabase.driver")
+    def test_sessions_reuse_pooled_driver(self, mock_driver, ingest_settings):
+        for _ in range(3):
+            with ingest_driver.get_session("db-tmp-scan-abc"):
+                pass
+
+        mock_driver.assert_called_once()
+        assert mock_driver.return_value.session.call_count == 3
+        mock_driver.return_value.session.assert_called_with(
+            database="db-tmp-scan-abc", default_access_mode=None
+        )
+
+    @patch("api.attack_paths.ingest.driver.neo4j.GraphDatabase.driver")
+    def test_concurrent_init_creates_single_driver(self, mock_driver, ingest_settings):
+        workers = 10
+        barrier = threading.Barrier(workers)
+
+        def slow_driver(*args, **kwargs):
+            # Widen the race window so an unguarded init would build twice
+            time.sleep(0.01)
+            return MagicMock()
+
+        mock_driver.side_effect = slow_driver
+
+        def call_init(_):
+            barrier.wait()
+            return ingest_driver.init_driver()
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            drivers = list(executor.map(call_init, range(workers)))
+
+        mock_driver.assert_called_once()
+        assert all(driver is drivers[0] for driver in drivers)
+
+
+class TestWorkerShutdownClosesDrivers:
+    """Celery pool processes exit via `os._exit`, so `atexit` never runs."""
+
+    def test_closes_drivers(self):
+        from api.signals import close_graph_drivers_on_worker_shutdown
+
+        with patch.object(db_module, "close_driver") as mock_close:
+            close_graph_drivers_on_worker_shutdown(pid=123, exitcode=0)
+
+        mock_close.assert_called_once_with()
+
+    def test_close_failure_does_not_propagate(self):
+        from api.signals import close_graph_drivers_on_worker_shutdown
+
+        with patch.object(
+            db_module, "close_driver", side_effect=RuntimeError("socket stuck")
+        ):
+            close_graph_drivers_on_worker_shutdown(pid=123, exitcode=0)
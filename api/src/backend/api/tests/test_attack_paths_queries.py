@@ -27,6 +27,9 @@ from api.attack_paths.queries.types import (
     AttackPathsQueryOutcome,
 )
 
+# Cypher parameter references, e.g. `$provider_uid`.
+PARAMETER_REFERENCE_PATTERN = re.compile(r"\$(\w+)")
+
 # The pathfinding.cloud privilege-escalation queries added for PROWLER-2278.
 NEW_PATHFINDING_QUERIES = [
     AWS_STS_PRIVESC_CROSS_ACCOUNT_TRUST,
@@ -200,6 +203,57 @@ class TestNewPathfindingQueriesCypher:
         )
 
 
+def _registered_queries():
+    """Every query in the current and deprecated catalogs, for all providers."""
+    from api.attack_paths.queries.registry import (
+        _DEPRECATED_QUERY_DEFINITIONS,
+        _QUERY_DEFINITIONS,
+    )
+
+    return [
+        pytest.param(definition, id=f"{catalog}-{definition.id}")
+        for catalog, catalog_definitions in (
+            ("current", _QUERY_DEFINITIONS),
+            ("deprecated", _DEPRECATED_QUERY_DEFINITIONS),
+        )
+        for definitions in catalog_definitions.values()
+        for definition in definitions
+    ]
+
+
+_REGISTERED_QUERIES = _registered_queries()
+
+
+class TestQueryCatalogParameterization:
+    """Request values reach Cypher as `$parameters`, keeping query text stable.
+
+    Neo4j keys its plan cache by query text, so a definition's Cypher must be
+    identical across requests and every user-supplied value must be bound.
+    """
+
+    @pytest.mark.parametrize("query", _REGISTERED_QUERIES)
+    def test_declared_parameters_are_bound(self, query):
+        referenced = set(
+            PARAMETER_REFERENCE_PATTERN.findall(_strip_comment_lines(query.cypher))
+        )
+        for parameter in query.parameters:
+            assert parameter.name in referenced, (
+                f"Query {query.id} declares `{parameter.name}` but never "
+                f"references ${parameter.name}"
+            )
+
+    @pytest.mark.parametrize("query", _REGISTERED_QUERIES)
+    def test_references_only_declared_parameters(self, query):
+        declared = {"provider_uid"} | {p.name for p in query.parameters}
+        referenced = set(
+            PARAMETER_REFERENCE_PATTERN.findall(_strip_comment_lines(query.cypher))
+        )
+        assert referenced <= declared, (
+            f"Query {query.id} references undeclared parameter(s): "
+            f"{sorted(referenced - declared)}"
+        )
+
+
 class TestNewPathfindingQueriesAccuracy:
     """Query-specific contracts that prevent known false positives."""
 
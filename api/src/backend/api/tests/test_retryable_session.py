@@ -2,7 +2,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 from api.attack_paths.retryable_session import RetryableSession, RetryExhaustedError
-from neo4j.exceptions import ServiceUnavailable
+from neo4j.exceptions import ServiceUnavailable, SessionExpired
 
 
 class TestRetryableSession:
@@ -163,3 +163,55 @@ class TestRetryableSession:
             1,
             3.0,
         )
+
+    def test_session_expired_is_retryable_for_read_sessions(self):
+        first_session = MagicMock()
+        first_session.execute_read.side_effect = SessionExpired("expired")
+        second_session = MagicMock()
+        second_session.execute_read.return_value = "success"
+        session = RetryableSession(
+            session_factory=MagicMock(side_effect=[first_session, second_session]),
+            max_retries=1,
+            max_retry_time_seconds=30,
+        )
+
+        assert session.execute_read(MagicMock()) == "success"
+
+    def test_session_expired_is_not_retried_without_read_budget(self):
+        error = SessionExpired("expired")
+        driver_session = MagicMock()
+        driver_session.execute_write.side_effect = error
+        session_factory = MagicMock(return_value=driver_session)
+        session = RetryableSession(session_factory=session_factory, max_retries=3)
+
+        with pytest.raises(SessionExpired) as exc_info:
+            session.execute_write(MagicMock())
+
+        assert exc_info.value is error
+        session_factory.assert_called_once_with()
+        driver_session.close.assert_not_called()
+
+    def test_retry_time_budget_stops_retrying_before_max_retries(self):
+        error = ServiceUnavailable("unavailable")
+        driver_sessions = [MagicMock() for _ in range(4)]
+        for driver_session in driver_sessions:
+            driver_session.execute_read.side_effect = error
+        session_factory = MagicMock(side_effect=driver_sessions)
+        session = RetryableSession(
+            session_factory=session_factory,
+            max_retries=3,
+            max_retry_time_seconds=30,
+        )
+
+        with (
+            patch(
+                "api.attack_paths.retryable_session.time.monotonic",
+                side_effect=[100.0, 110.0, 131.0],
+            ),
+            pytest.raises(ServiceUnavailable) as exc_info,
+        ):
+            session.execute_read(MagicMock())
+
+        assert exc_info.value is error
+        assert session_factory.call_count == 2
+        driver_sessions[1].close.assert_not_called()
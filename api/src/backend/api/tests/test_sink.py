@@ -17,7 +17,13 @@ from api.attack_paths.database import (
 )
 from api.attack_paths.retryable_session import RetryExhaustedError
 from api.attack_paths.sink import factory
-from api.attack_paths.sink.neo4j import DATABASE_NOT_FOUND_CODE, Neo4jSink
+from api.attack_paths.sink.base import stream_graph
+from api.attack_paths.sink.neo4j import (
+    DATABASE_NOT_FOUND_CODE,
+    MAX_TRANSACTION_RETRY_TIME,
+    PROCEDURE_NOT_FOUND_CODE,
+    Neo4jSink,
+)
 from api.attack_paths.sink.neptune import (
     NEPTUNE_WRITE_RETRY_DELAY_SECONDS,
     NeptuneSink,
@@ -74,6 +80,10 @@ class TestSinkFactory:
 
         assert isinstance(backend, Neo4jSink)
         mock_driver.assert_called_once()
+        driver_kwargs = mock_driver.call_args.kwargs
+        assert driver_kwargs["max_connection_pool_size"] == 100
+        # Retry cap is a per-session setting for reads, not a driver default
+        assert "max_transaction_retry_time" not in driver_kwargs
 
     @patch("api.attack_paths.sink.neptune.neptune_auth_provider")
     @patch("api.attack_paths.sink.neptune.neo4j.GraphDatabase.driver")
@@ -207,6 +217,24 @@ def _managed_write_session(
     return session, transactions
 
 
+def _periodic_result(
+    total: int,
+    batches: int,
+    failed_batches: int = 0,
+    error_messages: dict | None = None,
+) -> MagicMock:
+    return MagicMock(
+        single=MagicMock(
+            return_value={
+                "total": total,
+                "batches": batches,
+                "failedBatches": failed_batches,
+                "errorMessages": error_messages or {},
+            }
+        )
+    )
+
+
 def _directed_drop_results(
     outgoing_rels: int,
     incoming_rels: int,
@@ -222,6 +250,39 @@ def _directed_drop_results(
     ]
 
 
+class TestNeo4jSinkSessionRetryBudget:
+    @staticmethod
+    def _open_session(default_access_mode):
+        sink = Neo4jSink()
+        driver = MagicMock()
+        with (
+            patch.object(sink, "_get_driver", return_value=driver),
+            patch("api.attack_paths.sink.neo4j.RetryableSession") as retryable_session,
+        ):
+            with sink.get_session(
+                "db-tenant-x", default_access_mode=default_access_mode
+            ):
+                pass
+
+        retryable_session.call_args.kwargs["session_factory"]()
+        return driver.session.call_args.kwargs
+
+    def test_read_session_caps_transaction_retry_time(self):
+        session_kwargs = self._open_session(neo4j.READ_ACCESS)
+
+        assert session_kwargs["database"] == "db-tenant-x"
+        assert (
+            session_kwargs["max_transaction_retry_time"] == MAX_TRANSACTION_RETRY_TIME
+        )
+
+    @pytest.mark.parametrize("default_access_mode", [None, neo4j.WRITE_ACCESS])
+    def test_write_session_keeps_driver_retry_time(self, default_access_mode):
+        session_kwargs = self._open_session(default_access_mode)
+
+        assert session_kwargs["database"] == "db-tenant-x"
+        assert "max_transaction_retry_time" not in session_kwargs
+
+
 class TestNeo4jSinkSyncWrites:
     def test_ensure_sync_indexes_runs_create_index_idempotent(self):
         sink = Neo4jSink()
@@ -473,6 +534,44 @@ class TestNeptuneSinkDropSubgraph:
 class TestNeo4jSinkDropSubgraph:
     """Neo4j drop deletes relationships then nodes in batches (no ``DETACH DELETE``)."""
 
+    def test_drop_subgraph_uses_apoc_periodic_iterate_when_available(self):
+        sink = Neo4jSink()
+        session = MagicMock()
+        session.run.side_effect = [
+            _periodic_result(total=50, batches=1),
+            _periodic_result(total=30, batches=1),
+            _periodic_result(total=10, batches=1),
+        ]
+
+        provider_id = "00000000-0000-0000-0000-000000000abc"
+        with patch.object(sink, "get_session", return_value=_session_ctx(session)):
+            deleted = sink.drop_subgraph("db-tenant-x", provider_id)
+
+        assert deleted == 10
+        session.execute_write.assert_not_called()
+
+        calls = session.run.call_args_list
+        assert all("apoc.periodic.iterate" in call.args[0] for call in calls)
+        phases = [
+            (call.args[1]["match_query"], call.args[1]["delete_query"])
+            for call in calls
+        ]
+        assert ")-[r]->()" in phases[0][0]
+        assert ":`_Provider_00000000000000000000000000000abc`" in phases[0][0]
+        assert ")<-[r]-()" in phases[1][0]
+        assert [delete for _, delete in phases] == ["DELETE r", "DELETE r", "DELETE n"]
+
+    def test_drop_subgraph_raises_when_periodic_batches_fail(self):
+        sink = Neo4jSink()
+        session = MagicMock()
+        session.run.return_value = _periodic_result(
+            total=50, batches=1, failed_batches=1, error_messages={"boom": 1}
+        )
+
+        with patch.object(sink, "get_session", return_value=_session_ctx(session)):
+            with pytest.raises(RuntimeError, match="apoc.periodic.iterate failed"):
+                sink.drop_subgraph("db-tenant-x", "provider-1")
+
     def test_drop_subgraph_deletes_directed_rels_before_nodes_in_bounded_batches(self):
         sink = Neo4jSink()
         session, transactions = _managed_write_session(
@@ -482,6 +581,11 @@ class TestNeo4jSinkDropSubgraph:
                 nodes=10,
             )
         )
+        # Without APOC the drop falls back to client-driven batches
+        session.run.side_effect = neo4j.exceptions.Neo4jError._hydrate_neo4j(
+            code=PROCEDURE_NOT_FOUND_CODE,
+            message="There is no procedure with the name `apoc.periodic.iterate`",
+        )
 
         provider_id = "00000000-0000-0000-0000-000000000abc"
         with patch.object(sink, "get_session", return_value=_session_ctx(session)):
@@ -512,7 +616,7 @@ class TestNeo4jSinkDropSubgraph:
     def test_drop_subgraph_returns_zero_when_database_does_not_exist(self):
         sink = Neo4jSink()
         session = MagicMock()
-        session.execute_write.side_effect = GraphDatabaseQueryException(
+        session.run.side_effect = GraphDatabaseQueryException(
             message="db missing", code=DATABASE_NOT_FOUND_CODE
         )
 
@@ -522,6 +626,16 @@ class TestNeo4jSinkDropSubgraph:
         assert deleted == 0
 
 
+def test_stream_graph_drains_records_before_building_graph():
+    calls = []
+    result = MagicMock()
+    result.__iter__.side_effect = lambda: calls.append("iter") or iter([1, 2])
+    result.graph.side_effect = lambda: calls.append("graph") or "graph"
+
+    assert stream_graph(result) == "graph"
+    assert calls == ["iter", "graph"]
+
+
 class TestSinkHasProviderData:
     """``has_provider_data`` is the read-path probe used by API views."""
 
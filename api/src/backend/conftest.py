@@ -1936,11 +1936,16 @@ def sink_backend_stub():
         factory._secondary_backends.update(previous_secondary)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def attack_paths_graph_stub_classes():
-    """Provide lightweight graph element stubs for Attack Paths serialization tests."""
+    """Provide lightweight graph element stubs for Attack Paths serialization tests.
+
+    The stubs are stateless class definitions, so one set is shared by the session.
+    """
 
     class AttackPathsNativeValue:
+        __slots__ = ("_value",)
+
         def __init__(self, value):
             self._value = value
 
@@ -1948,12 +1953,16 @@ def attack_paths_graph_stub_classes():
             return self._value
 
     class AttackPathsNode:
+        __slots__ = ("element_id", "labels", "_properties")
+
         def __init__(self, element_id, labels, properties):
             self.element_id = element_id
             self.labels = labels
             self._properties = properties
 
     class AttackPathsRelationship:
+        __slots__ = ("element_id", "type", "start_node", "end_node", "_properties")
+
         def __init__(self, element_id, rel_type, start_node, end_node, properties):
             self.element_id = element_id
             self.type = rel_type
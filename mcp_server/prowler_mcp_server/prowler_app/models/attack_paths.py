@@ -297,7 +297,7 @@ class AttackPathsGraphNode(MinimalSerializerMixin, BaseModel):
             status = None
             status_extended = None
 
-        return cls(
+        return cls.model_construct(
             resource_id=properties.get("id", ""),
             labels=labels,
             properties=properties,
@@ -332,7 +332,7 @@ class AttackPathsGraphRelationship(MinimalSerializerMixin, BaseModel):
         Returns:
             AttackPathsGraphRelationship instance
         """
-        return cls(
+        return cls.model_construct(
             id=data["id"],
             label=data["label"],
             source=data["source"],
@@ -372,13 +372,16 @@ class AttackPathQueryResult(MinimalSerializerMixin, BaseModel):
         nodes_data = attributes.get("nodes", [])
         relationships_data = attributes.get("relationships", [])
 
+        # The graph is built by the Prowler API serializer, so per-element
+        # validation only repeats its checks; results can hold thousands of
+        # elements and none of these models define validators
         nodes = [AttackPathsGraphNode.from_api_response(n) for n in nodes_data]
         relationships = [
             AttackPathsGraphRelationship.from_api_response(r)
             for r in relationships_data
         ]
 
-        return cls(
+        return cls.model_construct(
             nodes=nodes,
             relationships=relationships,
         )
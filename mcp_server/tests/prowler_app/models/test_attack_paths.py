@@ -0,0 +1,95 @@
+"""Tests for the attack paths graph result models.
+
+Graph elements are built with ``model_construct`` (no per-element validation),
+so these tests pin what the agent receives: the ``model_dump()`` output.
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from prowler_mcp_server.prowler_app.models.attack_paths import (
+    AttackPathQueryResult,
+    AttackPathsGraphNode,
+    AttackPathsGraphRelationship,
+)
+from tests.helpers.jsonapi import jsonapi_document, jsonapi_resource
+
+FINDING_NODE = {
+    "id": "node-finding",
+    "labels": ["ProwlerFinding"],
+    "properties": {
+        "id": "finding-1",
+        "severity": "high",
+        "status": "FAIL",
+        "status_extended": "Bucket is public.",
+    },
+}
+
+RESOURCE_NODE = {
+    "id": "node-bucket",
+    "labels": ["S3Bucket"],
+    "properties": {"id": "arn:aws:s3:::my-bucket", "status": "ignored"},
+}
+
+RELATIONSHIP = {
+    "id": "rel-1",
+    "label": "HAS_FINDING",
+    "source": "node-bucket",
+    "target": "node-finding",
+}
+
+
+def _query_result_document(nodes, relationships):
+    return jsonapi_document(
+        jsonapi_resource(
+            "attack-paths-query-results",
+            "result-1",
+            {"nodes": nodes, "relationships": relationships},
+        )
+    )
+
+
+def test_query_result_dump_matches_api_graph():
+    result = AttackPathQueryResult.from_api_response(
+        _query_result_document([FINDING_NODE, RESOURCE_NODE], [RELATIONSHIP])
+    )
+
+    assert result.model_dump() == {
+        "nodes": [
+            {
+                "resource_id": "finding-1",
+                "labels": ["ProwlerFinding"],
+                "properties": FINDING_NODE["properties"],
+                "severity": "high",
+                "status": "FAIL",
+                "status_extended": "Bucket is public.",
+            },
+            {
+                "resource_id": "arn:aws:s3:::my-bucket",
+                "labels": ["S3Bucket"],
+                "properties": RESOURCE_NODE["properties"],
+            },
+        ],
+        "relationships": [RELATIONSHIP],
+    }
+
+
+def test_finding_fields_are_only_extracted_from_finding_nodes():
+    node = AttackPathsGraphNode.from_api_response(RESOURCE_NODE)
+
+    assert node.status is None
+    assert node.severity is None
+
+
+def test_empty_query_result_dumps_to_empty_dict():
+    result = AttackPathQueryResult.from_api_response(_query_result_document([], []))
+
+    assert result.nodes == []
+    assert result.model_dump() == {}
+
+
+def test_constructed_graph_elements_stay_frozen():
+    relationship = AttackPathsGraphRelationship.from_api_response(RELATIONSHIP)
+
+    with pytest.raises(ValidationError):
+        relationship.label = "CAN_ACCESS"
@@ -1,10 +1,16 @@
+import re
 from argparse import ArgumentTypeError, Namespace
-from re import fullmatch, search
 
 from prowler.providers.aws.aws_provider import AwsProvider
 from prowler.providers.aws.config import ROLE_SESSION_NAME
 from prowler.providers.aws.lib.arn.arn import arn_type
 
+# https://docs.aws.amazon.com/AmazonS3/latest/userguide/bucketnamingrules.html
+_BUCKET_NAME_RE = re.compile(
+    r"^(?!^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}$)(?!.*\.{2})(?!.*\.-)(?!.*-\.)(?!^xn--)(?!^sthree-)(?!^amzn-s3-demo-)(?!.*--table-s3$)[a-z0-9][a-z0-9.-]{1,61}[a-z0-9]$"
+)
+_ROLE_SESSION_NAME_RE = re.compile(r"[\w+=,.@-]{2,64}")
+
 
 def init_parser(self):
     """Init the AWS Provider CLI parser"""
@@ -57,6 +63,8 @@ def init_parser(self):
         help="External ID to be passed when assuming role",
     )
     # AWS Regions
+    # Parsed once: both region options validate against the same regions file
+    aws_regions = AwsProvider.get_regions(partition=None)
     aws_regions_subparser = aws_parser.add_argument_group("AWS Regions")
     aws_regions_subparser.add_argument(
         "--region",
@@ -64,7 +72,7 @@ def init_parser(self):
         "-f",
         nargs="+",
         help="AWS region names to run Prowler against",
-        choices=AwsProvider.get_regions(partition=None),
+        choices=aws_regions,
     )
     aws_regions_subparser.add_argument(
         "--excluded-region",
@@ -74,7 +82,7 @@ def init_parser(self):
             "AWS region names to exclude from the scan. Overrides the "
             "PROWLER_AWS_DISALLOWED_REGIONS environment variable when set."
         ),
-        choices=AwsProvider.get_regions(partition=None),
+        choices=aws_regions,
     )
     # AWS Organizations
     aws_orgs_subparser = aws_parser.add_argument_group("AWS Organizations")
@@ -181,8 +189,7 @@ def init_parser(self):
 def validate_session_duration(session_duration: int) -> int:
     """validate_session_duration validates that the input session_duration is valid"""
     duration = int(session_duration)
-    # Since the range(i,j) goes from i to j-1 we have to j+1
-    if duration not in range(900, 43201):
+    if not 900 <= duration <= 43200:
         raise ArgumentTypeError(
             "Session duration must be between 900 and 43200 seconds"
         )
@@ -206,7 +213,7 @@ def validate_role_session_name(session_name) -> str:
     Documentation:
         - AWS STS AssumeRole API: https://docs.aws.amazon.com/STS/latest/APIReference/API_AssumeRole.html
     """
-    if fullmatch(r"[\w+=,.@-]{2,64}", session_name):
+    if _ROLE_SESSION_NAME_RE.fullmatch(session_name):
         return session_name
     else:
         raise ArgumentTypeError(
@@ -234,10 +241,7 @@ def validate_arguments(arguments: Namespace) -> tuple[bool, str]:
 
 def validate_bucket(bucket_name: str) -> str:
     """validate_bucket validates that the input bucket_name is valid"""
-    if search(
-        r"^(?!^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}$)(?!.*\.{2})(?!.*\.-)(?!.*-\.)(?!^xn--)(?!^sthree-)(?!^amzn-s3-demo-)(?!.*--table-s3$)[a-z0-9][a-z0-9.-]{1,61}[a-z0-9]$",
-        bucket_name,
-    ):
+    if _BUCKET_NAME_RE.match(bucket_name):
         return bucket_name
     else:
         raise ArgumentTypeError(
@@ -35,6 +35,10 @@ from prowler.providers.googleworkspace.models import (
     GoogleWorkspaceSession,
 )
 
+DELEGATED_USER_EMAIL_RE = re.compile(
+    r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
+)
+
 
 class GoogleworkspaceProvider(Provider):
     """
@@ -213,8 +217,7 @@ class GoogleworkspaceProvider(Provider):
                 )
 
         # Validate email format with regex
-        email_pattern = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
-        if not email_pattern.match(delegated_user):
+        if not DELEGATED_USER_EMAIL_RE.match(delegated_user):
             raise GoogleWorkspaceInvalidCredentialsError(
                 file=os.path.basename(__file__),
                 message=f"Invalid delegated user email format: {delegated_user}. Must be a valid email address.",
@@ -362,7 +365,9 @@ class GoogleworkspaceProvider(Provider):
                     message=f"Failed to verify delegation for user {delegated_user}: {error}",
                 )
 
-        session = GoogleWorkspaceSession(credentials=delegated_credentials)
+        session = GoogleWorkspaceSession(
+            credentials=delegated_credentials, directory_service=test_service
+        )
         return session, delegated_user
 
     @staticmethod
@@ -383,23 +388,25 @@ class GoogleworkspaceProvider(Provider):
         Raises:
             GoogleWorkspaceSetUpIdentityError: If identity setup fails.
         """
-        # Build the Admin SDK Directory service
-        try:
-            service = build(
-                "admin",
-                "directory_v1",
-                credentials=session.credentials,
-                cache_discovery=False,
-            )
-        except Exception as error:
-            logger.error(
-                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}] -- {error}"
-            )
-            raise GoogleWorkspaceSetUpIdentityError(
-                file=os.path.basename(__file__),
-                original_exception=error,
-                message=f"Failed to build Admin SDK service. Ensure the Admin SDK API is enabled: {error}",
-            )
+        # Reuse the Admin SDK Directory service built by setup_session, if any
+        service = session.directory_service
+        if service is None:
+            try:
+                service = build(
+                    "admin",
+                    "directory_v1",
+                    credentials=session.credentials,
+                    cache_discovery=False,
+                )
+            except Exception as error:
+                logger.error(
+                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}] -- {error}"
+                )
+                raise GoogleWorkspaceSetUpIdentityError(
+                    file=os.path.basename(__file__),
+                    original_exception=error,
+                    message=f"Failed to build Admin SDK service. Ensure the Admin SDK API is enabled: {error}",
+                )
 
         # Extract domain from delegated user email for validation
         # (email format already validated in setup_session)
@@ -431,11 +438,11 @@ class GoogleworkspaceProvider(Provider):
         # The scope admin.directory.domain.readonly is already in SCOPES above
         try:
             domains_response = service.domains().list(customer="my_customer").execute()
-            valid_domains = [
+            valid_domains = frozenset(
                 domain.get("domainName", "").lower()
                 for domain in domains_response.get("domains", [])
                 if domain.get("domainName")
-            ]
+            )
         except Exception as error:
             # No fallback - fail if we cannot fetch domains
             logger.error(
@@ -457,7 +464,7 @@ class GoogleworkspaceProvider(Provider):
         if user_domain.lower() not in valid_domains:
             raise GoogleWorkspaceInvalidCredentialsError(
                 file=os.path.basename(__file__),
-                message=f"Delegated user domain {user_domain} is not configured in this Google Workspace. Valid domains: {', '.join(valid_domains)}. Ensure the delegated user belongs to the correct workspace or domain alias.",
+                message=f"Delegated user domain {user_domain} is not configured in this Google Workspace. Valid domains: {', '.join(sorted(valid_domains))}. Ensure the delegated user belongs to the correct workspace or domain alias.",
             )
 
         # Fetch root org unit ID for policy filtering
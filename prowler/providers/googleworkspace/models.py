@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Any, Optional
 
 from google.oauth2.service_account import Credentials
 from pydantic.v1 import BaseModel
@@ -11,6 +11,8 @@ class GoogleWorkspaceSession(BaseModel):
     """Google Workspace session containing credentials"""
 
     credentials: Credentials
+    # Admin SDK Directory client built while verifying delegation, reused by setup_identity
+    directory_service: Optional[Any] = None
 
     class Config:
         arbitrary_types_allowed = True
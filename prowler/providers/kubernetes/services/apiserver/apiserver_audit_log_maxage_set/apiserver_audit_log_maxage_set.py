@@ -1,29 +1,44 @@
+from typing import List, Optional
+
 from prowler.lib.check.models import Check, Check_Report_Kubernetes
 from prowler.providers.kubernetes.services.apiserver.apiserver_client import (
     apiserver_client,
 )
 
 
+def _audit_log_maxage(command: Optional[List[str]]) -> Optional[int]:
+    """Return the effective --audit-log-maxage value in a container command, if any.
+
+    kube-apiserver keeps the last occurrence of a repeated flag, so the command
+    is scanned from the end.
+    """
+    audit_log_maxage = next(
+        (
+            argument.partition("=")[2]
+            for argument in reversed(command or [])
+            if argument.startswith("--audit-log-maxage=")
+        ),
+        None,
+    )
+    return int(audit_log_maxage) if audit_log_maxage is not None else None
+
+
 class apiserver_audit_log_maxage_set(Check):
     def execute(self) -> Check_Report_Kubernetes:
         findings = []
+        metadata = self.metadata()
+        expected_audit_log_maxage = apiserver_client.audit_config.get(
+            "audit_log_maxage", 30
+        )
         for pod in apiserver_client.apiserver_pods:
-            report = Check_Report_Kubernetes(metadata=self.metadata(), resource=pod)
+            report = Check_Report_Kubernetes(metadata=metadata, resource=pod)
             report.status = "PASS"
             report.status_extended = f"Audit log max age is set appropriately in the API server in pod {pod.name}."
-            audit_log_maxage_set = False
-            for container in pod.containers.values():
-                audit_log_maxage_set = False
-                # Check if "--audit-log-maxage" is set to 30 or as appropriate
-                for command in container.command:
-                    if command.startswith("--audit-log-maxage"):
-                        if int(
-                            command.split("=")[1]
-                        ) == apiserver_client.audit_config.get("audit_log_maxage", 30):
-                            audit_log_maxage_set = True
-                            break
-                if not audit_log_maxage_set:
-                    break
+            # Check if "--audit-log-maxage" is set to 30 or as appropriate in every container
+            audit_log_maxage_set = bool(pod.containers) and all(
+                _audit_log_maxage(container.command) == expected_audit_log_maxage
+                for container in pod.containers.values()
+            )
 
             if not audit_log_maxage_set:
                 report.status = "FAIL"
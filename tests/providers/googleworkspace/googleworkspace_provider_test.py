@@ -348,6 +348,29 @@ class TestGoogleWorkspaceProvider:
                 )
             assert "is not configured in this Google Workspace" in str(exc_info.value)
 
+    def test_setup_identity_reuses_session_directory_service(self):
+        """Test the Directory client built by setup_session is not rebuilt"""
+        mock_service = MagicMock()
+        mock_service.customers().get().execute.return_value = {"id": CUSTOMER_ID}
+        mock_service.domains().list().execute.return_value = {
+            "domains": [{"domainName": DOMAIN}]
+        }
+        mock_session = GoogleWorkspaceSession(
+            credentials=MagicMock(spec=Credentials), directory_service=mock_service
+        )
+
+        with patch(
+            "prowler.providers.googleworkspace.googleworkspace_provider.build"
+        ) as mock_build:
+            identity = GoogleworkspaceProvider.setup_identity(
+                session=mock_session,
+                delegated_user=DELEGATED_USER,
+            )
+
+        mock_build.assert_not_called()
+        assert identity.customer_id == CUSTOMER_ID
+        assert identity.domain == DOMAIN
+
     def test_setup_identity_fetches_root_org_unit(self):
         """Test that setup_identity fetches and stores the root org unit ID"""
         mock_session = GoogleWorkspaceSession(credentials=MagicMock(spec=Credentials))
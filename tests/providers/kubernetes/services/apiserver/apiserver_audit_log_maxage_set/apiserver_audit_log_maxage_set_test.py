@@ -0,0 +1,159 @@
+from unittest import mock
+
+from prowler.providers.kubernetes.services.core.core_service import Container
+from tests.providers.kubernetes.kubernetes_fixtures import (
+    set_mocked_kubernetes_provider,
+)
+from tests.providers.kubernetes.services.core.conftest import make_pod
+
+MODULE = "prowler.providers.kubernetes.services.apiserver.apiserver_audit_log_maxage_set.apiserver_audit_log_maxage_set"
+
+
+def make_apiserver_container(name="kube-apiserver", command=None):
+    return Container(
+        name=name,
+        image="registry.k8s.io/kube-apiserver:v1.30.0",
+        command=command,
+        ports=None,
+        env=None,
+        security_context={},
+    )
+
+
+def run_check(pods, audit_config=None):
+    apiserver_client = mock.MagicMock()
+    apiserver_client.apiserver_pods = pods
+    apiserver_client.audit_config = audit_config if audit_config is not None else {}
+
+    with (
+        mock.patch(
+            "prowler.providers.common.provider.Provider.get_global_provider",
+            return_value=set_mocked_kubernetes_provider(),
+        ),
+        mock.patch(f"{MODULE}.apiserver_client", new=apiserver_client),
+    ):
+        from prowler.providers.kubernetes.services.apiserver.apiserver_audit_log_maxage_set.apiserver_audit_log_maxage_set import (
+            apiserver_audit_log_maxage_set,
+        )
+
+        return apiserver_audit_log_maxage_set().execute()
+
+
+class Test_apiserver_audit_log_maxage_set:
+    def test_no_pods(self):
+        assert run_check([]) == []
+
+    def test_maxage_set(self):
+        pod = make_pod(
+            containers={
+                "kube-apiserver": make_apiserver_container(
+                    command=["kube-apiserver", "--audit-log-maxage=30"]
+                )
+            }
+        )
+
+        result = run_check([pod])
+
+        assert len(result) == 1
+        assert result[0].status == "PASS"
+        assert (
+            result[0].status_extended
+            == "Audit log max age is set appropriately in the API server in pod test-pod."
+        )
+
+    def test_maxage_set_to_configured_value(self):
+        pod = make_pod(
+            containers={
+                "kube-apiserver": make_apiserver_container(
+                    command=["kube-apiserver", "--audit-log-maxage=90"]
+                )
+            }
+        )
+
+        result = run_check([pod], audit_config={"audit_log_maxage": 90})
+
+        assert result[0].status == "PASS"
+
+    def test_maxage_wrong_value(self):
+        pod = make_pod(
+            containers={
+                "kube-apiserver": make_apiserver_container(
+                    command=["kube-apiserver", "--audit-log-maxage=7"]
+                )
+            }
+        )
+
+        result = run_check([pod])
+
+        assert result[0].status == "FAIL"
+        assert (
+            result[0].status_extended
+            == "Audit log max age is not set to 30 or as appropriate in pod test-pod."
+        )
+
+    def test_maxage_flag_without_value(self):
+        pod = make_pod(
+            containers={
+                "kube-apiserver": make_apiserver_container(
+                    command=["kube-apiserver", "--audit-log-maxage"]
+                )
+            }
+        )
+
+        result = run_check([pod])
+
+        assert result[0].status == "FAIL"
+
+    def test_maxage_repeated_flag_uses_last_value(self):
+        pod = make_pod(
+            containers={
+                "kube-apiserver": make_apiserver_container(
+                    command=[
+                        "kube-apiserver",
+                        "--audit-log-maxage=30",
+                        "--audit-log-path=/var/log/audit.log",
+                        "--audit-log-maxage=1",
+                    ]
+                )
+            }
+        )
+
+        result = run_check([pod])
+
+        assert result[0].status == "FAIL"
+
+    def test_maxage_repeated_flag_last_value_appropriate(self):
+        pod = make_pod(
+            containers={
+                "kube-apiserver": make_apiserver_container(
+                    command=[
+                        "kube-apiserver",
+                        "--audit-log-maxage=1",
+                        "--audit-log-maxage=30",
+                    ]
+                )
+            }
+        )
+
+        result = run_check([pod])
+
+        assert result[0].status == "PASS"
+
+    def test_maxage_missing_in_one_container(self):
+        pod = make_pod(
+            containers={
+                "kube-apiserver": make_apiserver_container(
+                    command=["kube-apiserver", "--audit-log-maxage=30"]
+                ),
+                "sidecar": make_apiserver_container(name="sidecar", command=None),
+            }
+        )
+
+        result = run_check([pod])
+
+        assert result[0].status == "FAIL"
+
+    def test_pod_without_containers(self):
+        result = run_check([make_pod()])
+
+        assert result[0].status == "FAIL"